@@ -0,0 +1,116 @@
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import click
+
+DEFAULT_MODULES = (
+    "wordle_helper.client",
+    "wordle_helper.console",
+    "wordle_helper.database",
+    "wordle_helper",
+)
+
+
+def parse_importtime(output):
+    """
+    Return {module: (self_us, cumulative_us)} from the `-X importtime` report
+    in `output`.
+    """
+    imports = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # The header line.
+            continue
+        imports[module.strip()] = (int(self_us), int(cumulative_us))
+    return imports
+
+
+def measure_import(module, repeat):
+    """
+    Import `module` in `repeat` fresh interpreters and return, for each module
+    it imports, its lowest self and cumulative import times across runs, with
+    the lowest wall time of a whole run.
+    """
+    best = {}
+    wall_seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        wall_seconds = min(wall_seconds, time.perf_counter() - start)
+        for name, times in parse_importtime(completed.stderr).items():
+            best[name] = tuple(map(min, zip(best.get(name, times), times)))
+    return best, wall_seconds
+
+
+@click.command()
+@click.option(
+    "--module",
+    "modules",
+    multiple=True,
+    default=DEFAULT_MODULES,
+    show_default=True,
+    help="Module to import, can be repeated.",
+)
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=15,
+    show_default=True,
+    help="Number of most expensive imports to report per module.",
+)
+@click.option(
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="File to write the JSON results to.  [default: stdout]",
+)
+def main(modules, repeat, top, output):
+    """
+    Measure the cold import cost of wordle_helper modules with
+    `python -X importtime` and write it as JSON, so that results can be kept
+    and compared from release to release.
+    """
+    results = {}
+    for module in modules:
+        imports, wall_seconds = measure_import(module, repeat)
+        slowest = sorted(imports.items(), key=lambda item: item[1][1], reverse=True)
+        results[module] = {
+            "cumulative_us": imports[module][1],
+            "wall_seconds": round(wall_seconds, 4),
+            "imported_modules": len(imports),
+            "loads_sqlalchemy": "sqlalchemy" in imports,
+            "loads_numpy": "numpy" in imports,
+            "slowest": [
+                {"module": name, "self_us": self_us, "cumulative_us": cumulative_us}
+                for name, (self_us, cumulative_us) in slowest[:top]
+            ],
+        }
+        click.echo(
+            f"{module}: {imports[module][1] / 1000:.1f}ms import, "
+            f"{wall_seconds * 1000:.1f}ms wall",
+            err=True,
+        )
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
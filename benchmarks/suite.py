@@ -0,0 +1,370 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+import click
+
+from importtime import measure_import
+from workloads import (
+    QUERY_CORPUS_SIZE,
+    SYNTHETIC_WORDS,
+    query_corpus,
+    synthetic_words,
+    write_word_list,
+)
+from wordle_helper.wire import DAEMON_SOCKET_ENV
+from wordle_helper.words import read_words
+
+# Queries against the synthetic list each scan up to a million words, so fewer
+# of them are run.
+SYNTHETIC_QUERY_CORPUS_SIZE = 200
+
+DEFAULT_THRESHOLD = 0.1
+
+# The stored reference report that `compare` checks runs against by default.
+# Times depend on the machine, so it should be regenerated with `run` whenever
+# the reference machine changes or a slowdown is accepted.
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+CLI_QUERY = ["--first_letter", "s", "--unused_letters", "adpiun"]
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register the decorated function as the benchmark `name`. It is called with
+    the Workloads and returns the seconds taken by the part it measures, so
+    that setup is left out.
+    """
+
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+class Workloads:
+    """
+    The inputs shared by benchmarks, each built on first use and reused by
+    every repetition: the word lists, their query corpora and a synthetic word
+    list written to `directory`.
+    """
+
+    def __init__(self, directory, synthetic_size=SYNTHETIC_WORDS):
+        self.directory = Path(directory)
+        self.synthetic_size = synthetic_size
+        self.built = {}
+
+    def get(self, name, build):
+        if name not in self.built:
+            self.built[name] = build()
+        return self.built[name]
+
+    @property
+    def words(self):
+        return self.get("words", lambda: [word for word, _order in read_words()])
+
+    @property
+    def corpus(self):
+        return self.get("corpus", lambda: query_corpus(self.words, QUERY_CORPUS_SIZE))
+
+    @property
+    def synthetic_path(self):
+        def build():
+            path = self.directory / "synthetic-words.txt"
+            write_word_list(synthetic_words(self.synthetic_size), path)
+            return path
+
+        return self.get("synthetic_path", build)
+
+    @property
+    def synthetic_corpus(self):
+        def build():
+            words = [word for word, _order in read_words(self.synthetic_path)]
+            return query_corpus(words, SYNTHETIC_QUERY_CORPUS_SIZE)
+
+        return self.get("synthetic_corpus", build)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def run_cli(args):
+    # Point the client at a socket no daemon listens on, so that queries are
+    # answered by a cold CLI even while a daemon runs.
+    env = dict(os.environ, **{DAEMON_SOCKET_ENV: os.devnull})
+    command = "from wordle_helper.client import main; main()"
+    subprocess.run(
+        [sys.executable, "-c", command, *args],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+@benchmark("import_client")
+def import_client(workloads):
+    imports, _wall_seconds = measure_import("wordle_helper.client", 1)
+    return imports["wordle_helper.client"][1] / 1e6
+
+
+@benchmark("cli_cold_start_bitset")
+def cli_cold_start_bitset(workloads):
+    return timed(run_cli, CLI_QUERY)
+
+
+@benchmark("cli_cold_start_sql")
+def cli_cold_start_sql(workloads):
+    # The first run builds the prebuilt database if it is missing or stale.
+    workloads.get("prebuilt_database", lambda: run_cli(["--engine", "sql"]))
+    return timed(run_cli, ["--engine", "sql", *CLI_QUERY])
+
+
+@benchmark("setup_database_sgb")
+def setup_database_sgb(workloads):
+    from wordle_helper.database import setup_database
+
+    start = time.perf_counter()
+    engine = setup_database()
+    seconds = time.perf_counter() - start
+    engine.dispose()
+    return seconds
+
+
+@benchmark("setup_database_synthetic")
+def setup_database_synthetic(workloads):
+    from wordle_helper.database import setup_database
+
+    path = workloads.synthetic_path
+    start = time.perf_counter()
+    engine = setup_database(word_source_path=path)
+    seconds = time.perf_counter() - start
+    engine.dispose()
+    return seconds
+
+
+def query_database(engine, corpus):
+    from wordle_helper.database import query_database_for_words
+
+    for constraints in corpus:
+        consume(query_database_for_words(engine, **constraints))
+
+
+@benchmark("query_sql_sgb")
+def query_sql_sgb(workloads):
+    from wordle_helper.database import setup_database
+
+    engine = workloads.get("sgb_engine", setup_database)
+    return timed(query_database, engine, workloads.corpus)
+
+
+def query_index(index, corpus):
+    for constraints in corpus:
+        consume(index.query(**constraints))
+
+
+@benchmark("query_bitset_sgb")
+def query_bitset_sgb(workloads):
+    from wordle_helper.bitmaps import load_word_index
+
+    index = workloads.get("sgb_bitset", load_word_index)
+    return timed(query_index, index, workloads.corpus)
+
+
+@benchmark("query_compressed_sgb")
+def query_compressed_sgb(workloads):
+    from wordle_helper.bitmaps import CompressedWordIndex
+
+    index = workloads.get("sgb_compressed", CompressedWordIndex.from_file)
+    return timed(query_index, index, workloads.corpus)
+
+
+@benchmark("query_postings_sgb")
+def query_postings_sgb(workloads):
+    from wordle_helper.postings import PostingIndex
+
+    index = workloads.get("sgb_postings", PostingIndex.from_file)
+    return timed(query_index, index, workloads.corpus)
+
+
+@benchmark("query_numpy_sgb")
+def query_numpy_sgb(workloads):
+    # Skipped by `run` when numpy is not installed.
+    from wordle_helper.packed import PackedWordIndex
+
+    index = workloads.get("sgb_numpy", PackedWordIndex.from_file)
+    return timed(query_index, index, workloads.corpus)
+
+
+@benchmark("query_bitset_synthetic")
+def query_bitset_synthetic(workloads):
+    from wordle_helper.bitmaps import load_word_index
+
+    index = workloads.get(
+        "synthetic_bitset", lambda: load_word_index(workloads.synthetic_path)
+    )
+    return timed(query_index, index, workloads.synthetic_corpus)
+
+
+@benchmark("feedback_matrix_sgb")
+def feedback_matrix_sgb(workloads):
+    from wordle_helper.matrix import build_feedback_matrix
+
+    return timed(build_feedback_matrix, workloads.words)
+
+
+def simulate_all(strategy_name):
+    from wordle_helper.matrix import get_feedback_matrix
+    from wordle_helper.simulate import simulate
+
+    # Build or load the cached matrix outside of the measured time.
+    get_feedback_matrix()
+    return simulate(strategy_name, workers=1).seconds
+
+
+@benchmark("simulate_first")
+def simulate_first(workloads):
+    return simulate_all("first")
+
+
+@benchmark("simulate_entropy")
+def simulate_entropy(workloads):
+    return simulate_all("entropy")
+
+
+def run_benchmark(function, workloads, repeat):
+    runs = [function(workloads) for _ in range(repeat)]
+    return {
+        "seconds": min(runs),
+        "median": statistics.median(runs),
+        "runs": runs,
+    }
+
+
+def load_report(path):
+    try:
+        with click.open_file(str(path)) as f:
+            return json.load(f)["results"]
+    except (OSError, ValueError, KeyError) as e:
+        raise click.FileError(str(path), hint=str(e))
+
+
+@click.group()
+def main():
+    """
+    Reproducible benchmarks of loading, querying, solving and the CLI.
+    """
+
+
+@main.command("list")
+def list_command():
+    for name in BENCHMARKS:
+        click.echo(name)
+
+
+@main.command()
+@click.option(
+    "--benchmark",
+    "names",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS)),
+    help="Benchmark to run, can be repeated.  [default: all]",
+)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--synthetic-words",
+    type=click.IntRange(min=1),
+    default=SYNTHETIC_WORDS,
+    show_default=True,
+    help="Size of the synthetic word list.",
+)
+@click.option(
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="File to write the JSON results to.  [default: stdout]",
+)
+def run(names, repeat, synthetic_words, output):
+    """
+    Run the benchmarks and write the best, median and every time of each, in
+    seconds, as JSON.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        workloads = Workloads(directory, synthetic_size=synthetic_words)
+        for name in names or BENCHMARKS:
+            try:
+                results[name] = run_benchmark(BENCHMARKS[name], workloads, repeat)
+            except ImportError as e:
+                click.echo(f"{name}: skipped, {e}", err=True)
+                continue
+            click.echo(f"{name}: {results[name]['seconds'] * 1000:.1f}ms", err=True)
+    # Only the settings of the run are recorded, not the machine it ran on, so
+    # that the stored baseline holds nothing specific to one checkout or host.
+    report = {
+        "repeat": repeat,
+        "synthetic_words": synthetic_words,
+        "results": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+@main.command()
+@click.argument("reports", nargs=-1, required=True, metavar="[BASELINE] CURRENT")
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Largest slowdown that is not a regression, as a fraction.",
+)
+def compare(reports, threshold):
+    """
+    Compare the best times of two `run` reports and exit with status 1 if any
+    benchmark of CURRENT is slower than in BASELINE by more than the threshold.
+    BASELINE defaults to the stored benchmarks/baseline.json.
+    """
+    if len(reports) > 2:
+        raise click.UsageError("Expected at most a BASELINE and a CURRENT report")
+    if len(reports) == 1:
+        reports = (BASELINE_PATH, *reports)
+    baseline, current = (load_report(path) for path in reports)
+    regressions = []
+    width = max(map(len, {**baseline, **current}))
+    for name in {**baseline, **current}:
+        if name not in current or name not in baseline:
+            status = "only in baseline" if name in baseline else "new"
+            click.echo(f"{name:<{width}} {status}")
+            continue
+        before = baseline[name]["seconds"]
+        after = current[name]["seconds"]
+        change = after / before - 1 if before else 0.0
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        click.echo(
+            f"{name:<{width}} {before * 1000:10.1f}ms {after * 1000:10.1f}ms "
+            f"{change:+8.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
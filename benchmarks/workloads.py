@@ -0,0 +1,54 @@
+import random
+import string
+
+from wordle_helper.constraints import constraints_from_feedback
+from wordle_helper.feedback import score_guess
+
+SYNTHETIC_WORDS = 1_000_000
+QUERY_CORPUS_SIZE = 2000
+
+# Relative frequency of each letter of the alphabet in English text, in percent.
+# fmt: off
+LETTER_WEIGHTS = (
+    8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.2, 0.8, 4.0, 2.4,
+    6.7, 7.5, 1.9, 0.1, 6.0, 6.3, 9.1, 2.8, 1.0, 2.4, 0.2, 2.0, 0.1,
+)
+# fmt: on
+
+
+def synthetic_words(count, seed=0):
+    """
+    Return `count` distinct random five letter words in a reproducible order,
+    with letters drawn by their English frequency so that queries select
+    realistic fractions of the list.
+    """
+    rng = random.Random(seed)
+    words = {}
+    while len(words) < count:
+        word = "".join(rng.choices(string.ascii_lowercase, LETTER_WEIGHTS, k=5))
+        words.setdefault(word, None)
+    return list(words)
+
+
+def write_word_list(words, path):
+    with open(path, "w") as f:
+        f.writelines(f"{word}\n" for word in words)
+
+
+def query_corpus(words, count=QUERY_CORPUS_SIZE, seed=0):
+    """
+    Return `count` realistic query keyword arguments: the constraints a player
+    would type after one to three random guesses against a random answer of
+    `words`.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        answer = rng.choice(words)
+        guesses = rng.sample(words, rng.randint(1, 3))
+        corpus.append(
+            constraints_from_feedback(
+                (guess, score_guess(guess, answer)) for guess in guesses
+            )
+        )
+    return corpus
@@ -0,0 +1,94 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from wordle_helper.cache import DEFAULT_CACHE_SIZE
+from wordle_helper.constraints import parse_constraints
+from wordle_helper.helper import WordleHelper
+from wordle_helper.output import OUTPUT_BUFFER_SIZE, write_text
+from wordle_helper.words import WORD_SOURCE_PATH
+
+BATCH_CHUNK_SIZE = 1000
+
+# Chunks submitted ahead per worker, which keeps workers busy while bounding
+# the memory held by results waiting for an earlier, slower chunk.
+BATCH_CHUNKS_IN_FLIGHT_PER_WORKER = 4
+
+# The WordleHelper of a batch worker process, loaded once by its initializer.
+_worker_helper = None
+
+
+def run_batch_line(helper, line):
+    """
+    Return the JSON result line of the JSON constraint object in `line`: the
+    matching words and their count, or the error that made the line invalid.
+    """
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("Expected a JSON object of constraints")
+        constraints = parse_constraints(request)
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+    words = helper.query(**constraints)
+    return json.dumps({"count": len(words), "words": words})
+
+
+def run_batch(helper, lines):
+    for line in lines:
+        if line.strip():
+            yield run_batch_line(helper, line)
+
+
+def _initialize_batch_worker(engine, word_source_path, cache_size):
+    global _worker_helper
+    _worker_helper = WordleHelper(
+        engine=engine, word_source_path=word_source_path, cache_size=cache_size
+    )
+
+
+def _run_batch_chunk(lines):
+    return [run_batch_line(_worker_helper, line) for line in lines]
+
+
+def run_batch_parallel(
+    lines,
+    workers=None,
+    chunk_size=BATCH_CHUNK_SIZE,
+    word_source_path=WORD_SOURCE_PATH,
+    cache_size=DEFAULT_CACHE_SIZE,
+    engine="bitset",
+):
+    """
+    Like `run_batch` but spread chunks of `chunk_size` lines over `workers`
+    processes, one per CPU by default. Each worker loads its WordleHelper, on
+    the engine `engine` and with a cache of `cache_size` results, once.
+    Results are yielded in input order even though chunks finish out of order.
+    """
+    workers = workers or os.cpu_count() or 1
+    lines = (line for line in lines if line.strip())
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_batch_worker,
+        initargs=(engine, word_source_path, cache_size),
+    ) as executor:
+        pending = deque()
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(_run_batch_chunk, chunk))
+            if len(pending) >= workers * BATCH_CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_batch(results, output, buffer_size=OUTPUT_BUFFER_SIZE):
+    """
+    Write the `results` lines to the binary `output` stream in blocks of about
+    `buffer_size` characters rather than one write per line.
+    """
+    write_text((result + "\n" for result in results), output, buffer_size)
@@ -0,0 +1,179 @@
+from array import array
+
+from wordle_helper.index import WordIndex, count_bitset, iter_bitset, make_bitset
+from wordle_helper.words import WORD_SOURCE_PATH, read_words
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_BYTES = CHUNK_SIZE // 8
+LOW_MASK = CHUNK_SIZE - 1
+
+# A chunk with at most this many ids is stored as a sorted array of 16 bit
+# values, and as a 65536 bit integer above it, where the array would take more
+# than the 8 KiB of the integer.
+ARRAY_MAX_SIZE = 4096
+
+# Word lists with at least this many words are indexed with compressed bitmaps
+# by `load_word_index`. Below, the plain integer bitsets of a WordIndex are
+# small enough and faster.
+COMPRESSED_INDEX_MIN_WORDS = 1 << 17
+
+
+def _container(values):
+    """
+    Return the container of the sorted chunk `values`.
+    """
+    if len(values) > ARRAY_MAX_SIZE:
+        return make_bitset(values, CHUNK_SIZE)
+    return array("H", values)
+
+
+def _non_empty(container):
+    return container if len(container) else None
+
+
+# Results of operations are not converted back to the representation their size
+# calls for: they only live for a query, and keeping a dense chunk an integer
+# keeps later operations on it in C.
+
+
+def _and(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        return a & b or None
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        data = b.to_bytes(CHUNK_BYTES, "little")
+        return _non_empty(array("H", [v for v in a if data[v >> 3] >> (v & 7) & 1]))
+    if len(a) > len(b):
+        a, b = b, a
+    b = set(b)
+    return _non_empty(array("H", [v for v in a if v in b]))
+
+
+def _and_not(a, b):
+    if isinstance(a, int):
+        if not isinstance(b, int):
+            b = make_bitset(b, CHUNK_SIZE)
+        return a & ~b or None
+    if isinstance(b, int):
+        data = b.to_bytes(CHUNK_BYTES, "little")
+        return _non_empty(array("H", [v for v in a if not data[v >> 3] >> (v & 7) & 1]))
+    b = set(b)
+    return _non_empty(array("H", [v for v in a if v not in b]))
+
+
+class RoaringBitmap:
+    """
+    Immutable compressed set of word ids, after roaring bitmaps: ids are split
+    into chunks of 65536 by their high bits, and each non-empty chunk stores its
+    low bits as either a sorted array('H') when sparse, or an integer bitset
+    when dense. Operations work chunk by chunk, and an array operand costs time
+    proportional to its length.
+
+    Supports `&`, `a & ~b` (and not), `len()` and iteration in id order, like
+    the integer bitsets of a WordIndex.
+    """
+
+    __slots__ = ("containers",)
+
+    def __init__(self, containers=None):
+        # Maps the high bits of the ids to the container of their low bits.
+        self.containers = containers or {}
+
+    @classmethod
+    def from_ids(cls, ids, size=None):
+        chunks = {}
+        for i in ids:
+            chunks.setdefault(i >> CHUNK_BITS, []).append(i & LOW_MASK)
+        return cls({key: _container(sorted(values)) for key, values in chunks.items()})
+
+    @classmethod
+    def full(cls, size):
+        containers = {}
+        for key, start in enumerate(range(0, size, CHUNK_SIZE)):
+            count = min(CHUNK_SIZE, size - start)
+            containers[key] = _container(range(count))
+        return cls(containers)
+
+    def __and__(self, other):
+        if isinstance(other, Complement):
+            return self._and_not(other.bitmap)
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        mine, theirs = self.containers, other.containers
+        if len(mine) > len(theirs):
+            mine, theirs = theirs, mine
+        containers = {}
+        for key, container in mine.items():
+            if key in theirs:
+                result = _and(container, theirs[key])
+                if result is not None:
+                    containers[key] = result
+        return RoaringBitmap(containers)
+
+    def _and_not(self, other):
+        theirs = other.containers
+        containers = {}
+        for key, container in self.containers.items():
+            result = _and_not(container, theirs[key]) if key in theirs else container
+            if result is not None:
+                containers[key] = result
+        return RoaringBitmap(containers)
+
+    def __invert__(self):
+        return Complement(self)
+
+    def __len__(self):
+        return sum(
+            count_bitset(container) if isinstance(container, int) else len(container)
+            for container in self.containers.values()
+        )
+
+    def __bool__(self):
+        return bool(self.containers)
+
+    def __iter__(self):
+        for key in sorted(self.containers):
+            base = key << CHUNK_BITS
+            container = self.containers[key]
+            values = iter_bitset(container) if isinstance(container, int) else container
+            for value in values:
+                yield base + value
+
+
+class Complement:
+    """
+    The ids not in `bitmap`, which only exists to be ANDed with a RoaringBitmap.
+    """
+
+    __slots__ = ("bitmap",)
+
+    def __init__(self, bitmap):
+        self.bitmap = bitmap
+
+
+class CompressedWordIndex(WordIndex):
+    """
+    WordIndex whose sets of word ids are RoaringBitmaps instead of integers.
+    The sets of a large word list are mostly sparse, such as the words with an
+    x in one position, so this keeps memory use roughly proportional to the
+    number of words in each set instead of to the size of the word list.
+    """
+
+    empty = RoaringBitmap()
+    make_set = staticmethod(RoaringBitmap.from_ids)
+    full_set = staticmethod(RoaringBitmap.full)
+    iter_set = staticmethod(iter)
+    count_set = staticmethod(len)
+
+
+def load_word_index(word_source_path=WORD_SOURCE_PATH):
+    """
+    Return the index of the words of `word_source_path`: a WordIndex, or a
+    CompressedWordIndex from COMPRESSED_INDEX_MIN_WORDS words on.
+    """
+    words = [word for word, _order in read_words(word_source_path)]
+    if len(words) >= COMPRESSED_INDEX_MIN_WORDS:
+        return CompressedWordIndex(words)
+    return WordIndex(words)
@@ -0,0 +1,128 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+from wordle_helper.words import like_letter
+
+DEFAULT_CACHE_SIZE = 1024
+
+# The key of every query that no word can match, such as one that both requires
+# and excludes a letter.
+EMPTY_KEY = ("empty",)
+
+CacheStats = namedtuple(
+    "CacheStats", ["hits", "misses", "evictions", "size", "maxsize"]
+)
+
+
+def _letter_set(letters):
+    return "".join(sorted(set(letters)))
+
+
+def _is_ascii_upper(letter):
+    # Words are lower case, so no word has an upper case ASCII letter at a
+    # position, while LIKE folds it when looking for it anywhere.
+    return "A" <= letter <= "Z"
+
+
+def canonical_key(constraints):
+    """
+    Return a hashable key of the Constraints `constraints`, such
+    that queries with the same key match the same words. Letter sets are sorted
+    and deduplicated, letters are compared the way the SQL query does, and
+    constraints that other constraints imply are dropped:
+
+    - excluded letters of a position that also has a fixed letter, since the
+      query ignores them,
+    - excluded letters of a position that are unused letters as well,
+    - included letters (the excluded letters of any position) that are the
+      fixed letter of some position.
+
+    Queries that no word can match get EMPTY_KEY.
+    """
+    fixed = constraints.letters
+    not_letters = constraints.not_letters
+
+    unused = set()
+    for letter in constraints.unused_letters or "":
+        letter = like_letter(letter)
+        if letter is None:
+            # Every word "contains" a LIKE wildcard.
+            return EMPTY_KEY
+        unused.add(letter)
+
+    for letter in fixed:
+        if letter is not None and (
+            len(letter) != 1 or _is_ascii_upper(letter) or letter in unused
+        ):
+            return EMPTY_KEY
+
+    included = set()
+    for letters in not_letters:
+        for letter in letters:
+            letter = like_letter(letter)
+            if letter is not None and letter not in fixed:
+                included.add(letter)
+    if not included.isdisjoint(unused):
+        return EMPTY_KEY
+
+    excluded = []
+    for letter, letters in zip(fixed, not_letters):
+        if letter is not None:
+            letters = ""
+        excluded.append(
+            _letter_set(
+                l for l in letters if l not in unused and not _is_ascii_upper(l)
+            )
+        )
+    return (tuple(fixed), tuple(excluded), _letter_set(included), _letter_set(unused))
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of query results keyed by `canonical_key`, holding at
+    most `maxsize` results and counting its hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Return the result cached for `key` and mark it most recently used, or
+        None if there is none.
+        """
+        with self.lock:
+            result = self.results.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.results.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self.lock:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+
+    def stats(self):
+        with self.lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self.results),
+                maxsize=self.maxsize,
+            )
@@ -0,0 +1,54 @@
+import sys
+import time
+
+from wordle_helper.constraints import CONSTRAINT_FIELDS
+from wordle_helper.wire import query_daemon
+
+SHORT_OPTIONS = ("-1", "-2", "-3", "-4", "-5", "-n1", "-n2", "-n3", "-n4", "-n5", "-u")
+
+QUERY_OPTIONS = dict(zip(SHORT_OPTIONS, CONSTRAINT_FIELDS))
+QUERY_OPTIONS.update((f"--{field}", field) for field in CONSTRAINT_FIELDS)
+
+
+def parse_query_args(args):
+    """
+    Return the constraints of `args` if they only hold constraint options, or
+    None if they need the full CLI.
+    """
+    constraints = dict.fromkeys(CONSTRAINT_FIELDS)
+    args = iter(args)
+    for arg in args:
+        option, has_value, value = arg.partition("=")
+        field = QUERY_OPTIONS.get(option)
+        if field is None or (has_value and not option.startswith("--")):
+            return None
+        if not has_value:
+            value = next(args, None)
+            if value is None:
+                return None
+        constraints[field] = value
+    return constraints
+
+
+def main(args=None):
+    """
+    Console script entry point. Plain queries are forwarded to a running
+    `wordle_helper daemon` when there is one; everything else, and every query
+    when no daemon answers, runs through the regular `cli`.
+    """
+    args = sys.argv[1:] if args is None else args
+    constraints = parse_query_args(args)
+    if constraints is not None:
+        words = query_daemon(constraints)
+        if words is not None:
+            sys.stdout.write("".join(f"{word}\n" for word in words))
+            return
+
+    start = time.perf_counter()
+    from wordle_helper.console import cli
+
+    # Reported by --timings, which can only start timing once cli is imported.
+    import_seconds = time.perf_counter() - start
+    cli.main(
+        args=args, prog_name="wordle_helper", obj={"import_seconds": import_seconds}
+    )
@@ -0,0 +1,363 @@
+import asyncio
+import os
+import time
+from itertools import islice
+
+import click
+
+from wordle_helper.cache import DEFAULT_CACHE_SIZE
+from wordle_helper.console import constraint_options, engine_option
+from wordle_helper.constraints import Constraints
+from wordle_helper.daemon import run_daemon
+from wordle_helper.feedback import parse_feedback
+from wordle_helper.game import Game
+from wordle_helper.helper import WordleHelper
+from wordle_helper.index import WordIndex, iter_bitset
+from wordle_helper.loadgen import generate_load, sample_queries, summarize_load
+from wordle_helper.matrix import (
+    build_feedback_matrix,
+    feedback_matrix_path,
+    get_feedback_matrix,
+    save_feedback_matrix,
+)
+from wordle_helper.server import SERVE_HOST, SERVE_PORT, serve
+from wordle_helper.simulate import SIMULATION_CHUNK_SIZE, STRATEGIES, simulate
+from wordle_helper.solver import rank_guesses
+from wordle_helper.timing import NULL_TIMER, PhaseTimer
+from wordle_helper.tree import (
+    build_decision_tree,
+    decision_tree_path,
+    load_decision_tree,
+    save_decision_tree,
+)
+from wordle_helper.wire import daemon_socket_path
+from wordle_helper.words import PREBUILT_DB_PATH, WORD_SOURCE_PATH, read_words
+
+cache_size_option = click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_CACHE_SIZE,
+    show_default=True,
+    help="Number of distinct query results kept in memory, 0 to disable caching.",
+)
+
+PLAY_HELP = """\
+Enter each guess followed by its feedback, for example "crane g.y..", where g
+is green, y is yellow and . is grey. "words" lists all the remaining words,
+"reset" starts a new game and "quit" exits."""
+
+
+@click.command()
+@constraint_options
+@click.option(
+    "--top",
+    "-k",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of guesses to show.",
+)
+def suggest(top, **constraints):
+    """
+    Show the guesses that give the most information about the words that match
+    the constraints, with their expected information in bits.
+    """
+    index = WordIndex.from_file()
+    candidate_ids = list(iter_bitset(index.select(Constraints(**constraints))))
+    if not candidate_ids:
+        return
+    matrix = get_feedback_matrix()
+    for guess_id, entropy in rank_guesses(matrix, candidate_ids, top=top):
+        click.echo(f"{index.words[guess_id]} {entropy:.3f}")
+
+
+def load_tree_or_fail():
+    tree_path = decision_tree_path()
+    if not tree_path.exists():
+        raise click.ClickException(
+            f"No decision tree at {tree_path}: build it with `wordle_helper build-tree`"
+        )
+    try:
+        return load_decision_tree(tree_path)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+
+@click.command()
+@click.option(
+    "--show",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of remaining words to show after each round.",
+)
+@click.option(
+    "--tree",
+    "use_tree",
+    is_flag=True,
+    help="Suggest guesses from the decision tree built by build-tree.",
+)
+def play(show, use_tree):
+    """
+    Narrow down the answer interactively, one guess and its feedback at a time.
+    """
+    tree = load_tree_or_fail() if use_tree else None
+    game = Game(WordIndex.from_file(), tree=tree)
+    click.echo(PLAY_HELP)
+    if game.suggestion():
+        click.echo(f"Suggested guess: {game.suggestion()}")
+    while True:
+        try:
+            line = click.prompt("", prompt_suffix="> ", default="", show_default=False)
+        except click.Abort:
+            click.echo()
+            return
+        command = line.lower().split()
+        if not command:
+            continue
+        if command in (["quit"], ["exit"]):
+            return
+        if command == ["reset"]:
+            game.reset()
+        elif command == ["words"]:
+            click.echo(" ".join(game.words()))
+            continue
+        elif len(command) != 2 or len(command[0]) != 5:
+            click.echo(PLAY_HELP)
+            continue
+        else:
+            guess, feedback = command
+            try:
+                pattern = parse_feedback(feedback)
+            except ValueError as e:
+                click.echo(e)
+                continue
+            game.play_round(guess, pattern)
+
+        count = game.count()
+        words = list(islice(game.words(), show))
+        more = " ..." if count > len(words) else ""
+        click.echo(f"{count} words left: {' '.join(words)}{more}")
+        if game.suggestion():
+            click.echo(f"Suggested guess: {game.suggestion()}")
+
+
+@click.command("simulate")
+@click.option(
+    "--strategy",
+    type=click.Choice(sorted(STRATEGIES)),
+    default="first",
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Number of processes playing games, 0 for one per CPU.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=SIMULATION_CHUNK_SIZE,
+    show_default=True,
+    help="Number of games sent to a worker process at a time.",
+)
+@click.option(
+    "--games",
+    type=click.IntRange(min=1),
+    help="Only play against this many words of the list.  [default: all]",
+)
+def simulate_command(strategy, workers, chunk_size, games):
+    """
+    Play a game against every word of the word list and report how many guesses
+    the strategy needed.
+    """
+    if strategy == "tree":
+        # Fail here rather than in every worker process.
+        load_tree_or_fail()
+    report = simulate(strategy, workers=workers, chunk_size=chunk_size, games=games)
+    for line in report.lines():
+        click.echo(line)
+
+
+def load_helper(**options):
+    try:
+        return WordleHelper(**options)
+    except ImportError as e:
+        # The numpy engine is optional.
+        raise click.ClickException(str(e))
+
+
+@click.command("serve")
+@click.option("--host", default=SERVE_HOST, show_default=True)
+@click.option("--port", type=int, default=SERVE_PORT, show_default=True)
+@engine_option
+@cache_size_option
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Time the phases of every query and report them at /health.",
+)
+def serve_command(host, port, engine, cache_size, timings):
+    """
+    Answer queries over HTTP as JSON from one word index kept in memory.
+    """
+    timer = PhaseTimer() if timings else NULL_TIMER
+    helper = load_helper(engine=engine, cache_size=cache_size, timer=timer)
+    click.echo(f"Serving {len(helper)} words on http://{host}:{port}", err=True)
+    try:
+        asyncio.run(serve(helper, host=host, port=port))
+    except KeyboardInterrupt:
+        pass
+
+
+@click.command("daemon")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Unix socket to listen on.  [default: $WORDLE_HELPER_SOCKET, or "
+    "wordle_helper.sock in $XDG_RUNTIME_DIR or in a directory of the current "
+    "user in the temporary directory]",
+)
+@engine_option
+@cache_size_option
+def daemon_command(socket_path, engine, cache_size):
+    """
+    Keep the word index in memory and answer the queries of `wordle_helper`
+    runs over a Unix socket, so they skip building the index.
+    """
+    socket_path = socket_path or daemon_socket_path()
+    helper = load_helper(engine=engine, cache_size=cache_size)
+    click.echo(f"Serving {len(helper)} words on {socket_path}", err=True)
+    try:
+        asyncio.run(run_daemon(helper, socket_path))
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+
+@click.command("loadgen")
+@click.option(
+    "--url",
+    default=f"http://{SERVE_HOST}:{SERVE_PORT}",
+    show_default=True,
+    help="Address of a running `wordle_helper serve`.",
+)
+@click.option(
+    "--requests", type=click.IntRange(min=1), default=20000, show_default=True
+)
+@click.option(
+    "--concurrency", type=click.IntRange(min=1), default=100, show_default=True
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+def loadgen_command(url, requests, concurrency, seed):
+    """
+    Send realistic queries to a running `wordle_helper serve` over concurrent
+    keep-alive connections and report its throughput and latency.
+    """
+    words = [word for word, _order in read_words()]
+    targets = sample_queries(words, requests, seed=seed)
+    seconds, latencies = asyncio.run(generate_load(url, targets, concurrency))
+    for line in summarize_load(seconds, latencies):
+        click.echo(line)
+
+
+@click.command("build-tree")
+@click.option(
+    "--opener",
+    help="First guess of the tree.  [default: the highest-entropy word]",
+)
+@click.option(
+    "--word-source",
+    type=click.Path(exists=True, dir_okay=False),
+    default=str(WORD_SOURCE_PATH),
+    show_default=True,
+)
+def build_tree_command(opener, word_source):
+    """
+    Precompute the decision tree of the entropy solver, so that play --tree and
+    simulate --strategy tree only look up each move.
+    """
+    words = [word for word, _order in read_words(word_source)]
+    matrix = get_feedback_matrix(word_source)
+    if opener is None:
+        opener_id, _entropy = rank_guesses(matrix, range(len(words)), top=1)[0]
+    elif opener in words:
+        opener_id = words.index(opener)
+    else:
+        raise click.BadParameter(
+            f"{opener!r} is not in the word list", param_hint="--opener"
+        )
+    start = time.perf_counter()
+    tree = build_decision_tree(matrix, opener_id)
+    tree_path = decision_tree_path(word_source)
+    save_decision_tree(tree, tree_path, word_source_path=word_source)
+    click.echo(
+        f"Built {tree_path}: {len(tree.guesses)} nodes opening with "
+        f"{words[opener_id]} in {time.perf_counter() - start:.2f}s"
+    )
+
+
+@click.command("build-database")
+@click.option(
+    "--word-source",
+    type=click.Path(exists=True, dir_okay=False),
+    default=str(WORD_SOURCE_PATH),
+    show_default=True,
+)
+@click.option(
+    "--database",
+    type=click.Path(dir_okay=False),
+    default=str(PREBUILT_DB_PATH),
+    show_default=True,
+)
+@click.option("--force", is_flag=True, help="Rebuild even if the database is current.")
+def build_database_command(word_source, database, force):
+    """
+    Build the SQLite word database of the sql engine, unless it is up to date.
+    """
+    from wordle_helper.database import (
+        build_database,
+        is_database_current,
+        open_read_only_database,
+    )
+
+    if not force and os.path.exists(database):
+        engine = open_read_only_database(database)
+        is_current = is_database_current(engine, word_source_path=word_source)
+        engine.dispose()
+        if is_current:
+            click.echo(f"{database} is up to date")
+            return
+    load_stats = build_database(database, word_source_path=word_source)
+    click.echo(
+        f"Built {database}: loaded {load_stats.rows} words in "
+        f"{load_stats.seconds:.2f}s ({load_stats.rows_per_second:,.0f} words/s)"
+    )
+
+
+@click.command("build-matrix")
+@click.option(
+    "--word-source",
+    type=click.Path(exists=True, dir_okay=False),
+    default=str(WORD_SOURCE_PATH),
+    show_default=True,
+)
+@click.option("--force", is_flag=True, help="Rebuild even if the matrix exists.")
+def build_matrix_command(word_source, force):
+    """
+    Precompute the feedback matrix of the entropy solver, unless it exists.
+    """
+    matrix_path = feedback_matrix_path(word_source)
+    if not force and matrix_path.exists():
+        click.echo(f"{matrix_path} is up to date")
+        return
+    words = [word for word, _order in read_words(word_source)]
+    start = time.perf_counter()
+    matrix = build_feedback_matrix(words)
+    save_feedback_matrix(matrix, matrix_path)
+    click.echo(
+        f"Built {matrix_path}: {len(words)} x {len(words)} patterns in "
+        f"{time.perf_counter() - start:.2f}s"
+    )
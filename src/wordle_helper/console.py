@@ -0,0 +1,282 @@
+from importlib import import_module
+
+import click
+from click.core import ParameterSource
+
+from wordle_helper.batch import (
+    BATCH_CHUNK_SIZE,
+    run_batch,
+    run_batch_parallel,
+    write_batch,
+)
+from wordle_helper.cache import DEFAULT_CACHE_SIZE
+from wordle_helper.constraints import CONSTRAINT_FIELDS
+from wordle_helper.disk_cache import DEFAULT_DISK_CACHE_ENTRIES, DiskCache
+from wordle_helper.engines import ENGINES
+from wordle_helper.helper import WordleHelper
+from wordle_helper.output import OUTPUT_FORMATS, format_count, write_text, write_words
+from wordle_helper.timing import NULL_TIMER, PhaseTimer
+
+# Subcommands live in `wordle_helper.commands`, which imports numpy, asyncio and
+# the rest of what they need, so it is only imported when one of them is run or
+# listed by --help.
+LAZY_COMMANDS = {
+    "suggest": "wordle_helper.commands.suggest",
+    "play": "wordle_helper.commands.play",
+    "simulate": "wordle_helper.commands.simulate_command",
+    "serve": "wordle_helper.commands.serve_command",
+    "daemon": "wordle_helper.commands.daemon_command",
+    "loadgen": "wordle_helper.commands.loadgen_command",
+    "build-tree": "wordle_helper.commands.build_tree_command",
+    "build-database": "wordle_helper.commands.build_database_command",
+    "build-matrix": "wordle_helper.commands.build_matrix_command",
+}
+
+
+class LazyGroup(click.Group):
+    """
+    A click group that imports each of its `lazy_commands`, given as
+    "module.attribute" paths, the first time it is looked up.
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, name):
+        if name in self.lazy_commands and name not in self.commands:
+            module_name, _, attribute = self.lazy_commands[name].rpartition(".")
+            command = getattr(import_module(module_name), attribute)
+            self.add_command(command, name)
+        return super().get_command(ctx, name)
+
+
+def constraint_options(command):
+    options = [
+        click.option("--first_letter", "-1", type=str),
+        click.option("--second_letter", "-2", type=str),
+        click.option("--third_letter", "-3", type=str),
+        click.option("--fourth_letter", "-4", type=str),
+        click.option("--fifth_letter", "-5", type=str),
+        click.option("--not_first_letter", "-n1", type=str),
+        click.option("--not_second_letter", "-n2", type=str),
+        click.option("--not_third_letter", "-n3", type=str),
+        click.option("--not_fourth_letter", "-n4", type=str),
+        click.option("--not_fifth_letter", "-n5", type=str),
+        click.option("--unused_letters", "-u", type=str),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+engine_option = click.option(
+    "--engine",
+    type=click.Choice(list(ENGINES)),
+    default="bitset",
+    show_default=True,
+    help="Answer queries from in-memory bitsets, always compressed bitmaps, "
+    "sorted posting lists, which are faster for queries on rare letters of large "
+    "word lists, a NumPy array or the prebuilt SQLite database.",
+)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True)
+@constraint_options
+@engine_option
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Read one JSON object of constraints per line from stdin and write one "
+    "JSON result per line to stdout.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of processes answering --batch queries, 0 for one per CPU.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=BATCH_CHUNK_SIZE,
+    show_default=True,
+    help="Number of --batch lines sent to a worker process at a time.",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_CACHE_SIZE,
+    show_default=True,
+    help="Number of distinct --batch query results kept in memory by each "
+    "process, 0 to disable caching.",
+)
+@click.option(
+    "--count",
+    "count_only",
+    is_flag=True,
+    help="Print the number of matching words instead of the words.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    help="Print at most this many words.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="plain",
+    show_default=True,
+    help="Print one word per line, one JSON object per line, CSV with a header "
+    "or a single JSON array.",
+)
+@click.option(
+    "--disk-cache",
+    is_flag=True,
+    help="Keep query results in a cache file across runs, and answer repeated "
+    "queries from it without loading the word index.",
+)
+@click.option(
+    "--disk-cache-entries",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DISK_CACHE_ENTRIES,
+    show_default=True,
+    help="Number of query results kept by --disk-cache.",
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    help="Print the time spent in each phase of the run to stderr.",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False),
+    help="Profile the run with cProfile and write the stats to this file.",
+)
+@click.pass_context
+def cli(
+    ctx,
+    engine,
+    batch,
+    workers,
+    chunk_size,
+    cache_size,
+    count_only,
+    limit,
+    output_format,
+    disk_cache,
+    disk_cache_entries,
+    timings,
+    profile_path,
+    **constraints,
+):
+    # Both are stopped when the context closes, after any subcommand has run.
+    timer = NULL_TIMER
+    if timings:
+        timer = PhaseTimer()
+        import_seconds = (ctx.obj or {}).get("import_seconds")
+        if import_seconds is not None:
+            timer.add("imports", import_seconds)
+        ctx.call_on_close(lambda: _report_timings(timer))
+        ctx.with_resource(timer.phase("run"))
+    if profile_path:
+        _start_profile(ctx, profile_path)
+    if batch:
+        _reject_options(ctx, "--batch", BATCH_CONFLICTS)
+    else:
+        _reject_options(ctx, "--batch", BATCH_OPTIONS, missing=True)
+
+    if ctx.invoked_subcommand is not None:
+        return
+    output = click.get_binary_stream("stdout")
+    try:
+        if batch:
+            _run_batch(engine, workers, chunk_size, cache_size, timer, output)
+            return
+        if disk_cache:
+            disk_cache = DiskCache(max_entries=disk_cache_entries)
+        else:
+            disk_cache = None
+        helper = WordleHelper(engine=engine, disk_cache=disk_cache, timer=timer)
+        with timer.phase("output"):
+            if count_only:
+                count = helper.count(**constraints)
+                write_text([format_count(count, output_format)], output)
+            else:
+                words = helper.iter(limit=limit, **constraints)
+                write_words(words, output, output_format)
+    except ImportError as e:
+        # The numpy engine is optional.
+        raise click.ClickException(str(e))
+
+
+# Options of --batch only.
+BATCH_OPTIONS = ("workers", "chunk_size")
+
+# Options of single queries, which --batch reads from each line instead.
+BATCH_CONFLICTS = (
+    *CONSTRAINT_FIELDS,
+    "count_only",
+    "limit",
+    "output_format",
+    "disk_cache",
+    "disk_cache_entries",
+)
+
+
+def _reject_options(ctx, option, names, missing=False):
+    """
+    Raise a UsageError if any of the parameters `names` was given along with
+    `option`, or without it if `missing`.
+    """
+    given = [
+        param.opts[0]
+        for param in ctx.command.params
+        if param.name in names
+        and ctx.get_parameter_source(param.name) is not ParameterSource.DEFAULT
+    ]
+    if given and missing:
+        raise click.UsageError(f"{', '.join(given)} can only be used with {option}.")
+    if given:
+        raise click.UsageError(f"{option} cannot be used with {', '.join(given)}.")
+
+
+def _run_batch(engine, workers, chunk_size, cache_size, timer, output):
+    lines = click.get_text_stream("stdin")
+    if workers == 1:
+        helper = WordleHelper(engine=engine, cache_size=cache_size, timer=timer)
+        results = run_batch(helper, lines)
+    else:
+        results = run_batch_parallel(
+            lines,
+            workers=workers,
+            chunk_size=chunk_size,
+            cache_size=cache_size,
+            engine=engine,
+        )
+    with timer.phase("output"):
+        write_batch(results, output)
+
+
+def _report_timings(timer):
+    for line in timer.lines():
+        click.echo(line, err=True)
+
+
+def _start_profile(ctx, profile_path):
+    import cProfile
+
+    profiler = cProfile.Profile()
+
+    def stop_profile():
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+
+    ctx.call_on_close(stop_profile)
+    profiler.enable()
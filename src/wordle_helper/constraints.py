@@ -0,0 +1,106 @@
+from collections import namedtuple
+
+from wordle_helper.feedback import GREEN, GREY, YELLOW, pattern_colours
+
+CONSTRAINT_FIELDS = (
+    "first_letter",
+    "second_letter",
+    "third_letter",
+    "fourth_letter",
+    "fifth_letter",
+    "not_first_letter",
+    "not_second_letter",
+    "not_third_letter",
+    "not_fourth_letter",
+    "not_fifth_letter",
+    "unused_letters",
+)
+
+
+_Constraints = namedtuple(
+    "Constraints", CONSTRAINT_FIELDS, defaults=(None,) * len(CONSTRAINT_FIELDS)
+)
+
+
+class Constraints(_Constraints):
+    """
+    The constraints of a word query, the same for every engine, with the
+    meaning `query_database_for_words` gives them:
+
+    - `first_letter` to `fifth_letter`: the letter at that position, compared
+      exactly.
+    - `not_first_letter` to `not_fifth_letter`: letters not at that position,
+      compared exactly and ignored when the position has a letter. They must
+      all be in the word somewhere, which is checked the way SQLite's LIKE
+      does: ASCII letters are case folded, and % and _ match any word.
+    - `unused_letters`: letters in no position, compared like LIKE, so that a
+      wildcard rules out every word.
+
+    Empty strings mean the same as None.
+    """
+
+    __slots__ = ()
+
+    @property
+    def letters(self):
+        return tuple(letter or None for letter in self[:5])
+
+    @property
+    def not_letters(self):
+        return tuple(letters or "" for letters in self[5:10])
+
+    @property
+    def included_letters(self):
+        return "".join(self.not_letters)
+
+
+def parse_constraints(mapping):
+    """
+    Return the query keyword arguments of `mapping`, for example a decoded JSON
+    object, which uses the same field names as the CLI options. Missing fields
+    are None. Raise a ValueError for unknown fields or values that are neither
+    strings nor null.
+    """
+    unknown_fields = set(mapping).difference(CONSTRAINT_FIELDS)
+    if unknown_fields:
+        raise ValueError(
+            f"Unknown constraint fields: {', '.join(sorted(unknown_fields))}"
+        )
+    constraints = {}
+    for field in CONSTRAINT_FIELDS:
+        value = mapping.get(field)
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{field} must be a string")
+        constraints[field] = value
+    return constraints
+
+
+def constraints_from_feedback(rounds):
+    """
+    Return the query keyword arguments that express the (guess, pattern)
+    feedback `rounds` the way a player would type them as CLI options: green
+    letters as fixed letters, yellow letters as excluded letters at their
+    position and grey letters as unused letters.
+    """
+    letters = [None] * 5
+    not_letters = [""] * 5
+    unused_letters = ""
+    rounds = [(guess, pattern_colours(pattern)) for guess, pattern in rounds]
+    coloured = {
+        letter
+        for guess, colours in rounds
+        for letter, colour in zip(guess, colours)
+        if colour != GREY
+    }
+    for guess, colours in rounds:
+        for position, (letter, colour) in enumerate(zip(guess, colours)):
+            if colour == GREEN:
+                letters[position] = letter
+            elif colour == YELLOW:
+                if letter not in not_letters[position]:
+                    not_letters[position] += letter
+            elif letter not in coloured and letter not in unused_letters:
+                unused_letters += letter
+    values = letters + [excluded or None for excluded in not_letters]
+    values.append(unused_letters or None)
+    return dict(zip(CONSTRAINT_FIELDS, values))
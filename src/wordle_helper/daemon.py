@@ -0,0 +1,82 @@
+import asyncio
+import os
+import signal
+from pathlib import Path
+
+from wordle_helper.wire import (
+    MAX_REQUEST_SIZE,
+    REQUEST_HEADER,
+    STATUS_ERROR,
+    STATUS_OK,
+    decode_request,
+    encode_response,
+    is_daemon_running,
+)
+
+
+class QueryDaemon:
+    """
+    Answer word queries sent over a Unix domain socket from one WordleHelper
+    kept in memory. A connection can send any number of requests.
+    """
+
+    def __init__(self, helper):
+        self.helper = helper
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                (size,) = REQUEST_HEADER.unpack(
+                    await reader.readexactly(REQUEST_HEADER.size)
+                )
+                if size > MAX_REQUEST_SIZE:
+                    writer.write(encode_response(STATUS_ERROR, "Request too large"))
+                    break
+                try:
+                    constraints = decode_request(await reader.readexactly(size))
+                except ValueError as e:
+                    writer.write(encode_response(STATUS_ERROR, str(e)))
+                    break
+                words = self.helper.query(**constraints)
+                writer.write(encode_response(STATUS_OK, "\n".join(words)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run_daemon(helper, socket_path):
+    """
+    Serve queries on `socket_path` until interrupted or terminated, creating
+    its directory readable by the current user only if it is missing. Raise a
+    RuntimeError if another daemon already answers there; a stale socket file
+    is replaced.
+    """
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if socket_path.exists():
+        if is_daemon_running(socket_path):
+            raise RuntimeError(f"A daemon is already running on {socket_path}")
+        socket_path.unlink()
+    # Bind under a umask that leaves the socket to the current user from the
+    # start, rather than changing its mode once others could connect.
+    umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(
+            QueryDaemon(helper).handle_connection, path=str(socket_path)
+        )
+    finally:
+        os.umask(umask)
+    serving = asyncio.ensure_future(server.serve_forever())
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, serving.cancel)
+    try:
+        async with server:
+            await serving
+    except asyncio.CancelledError:
+        pass
+    finally:
+        if socket_path.exists():
+            socket_path.unlink()
@@ -0,0 +1,349 @@
+import os
+import time
+from collections import namedtuple
+from itertools import islice
+from pathlib import Path
+from urllib.parse import quote
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    String,
+    and_,
+    create_engine,
+    event,
+    func,
+)
+from sqlalchemy.exc import DatabaseError
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from wordle_helper.constraints import Constraints
+from wordle_helper.files import atomic_write_path
+from wordle_helper.timing import NULL_TIMER
+from wordle_helper.words import (
+    PREBUILT_DB_PATH,
+    WORD_SOURCE_PATH,
+    letter_bit,
+    letter_mask,
+    like_letter,
+    read_words,
+    word_source_checksum,
+)
+
+WORD_DB_PATH = ":memory:"
+
+# Bump whenever the layout of the prebuilt database changes so that existing
+# files are rebuilt instead of being read with the wrong schema.
+SCHEMA_VERSION = 3
+
+WORD_INSERT_CHUNK_SIZE = 10000
+
+# Rows ANALYZE samples per index, see https://sqlite.org/lang_analyze.html.
+ANALYSIS_LIMIT = 1000
+
+Base = declarative_base()
+
+
+class Word(Base):
+    __tablename__ = "words"
+    word = Column(String(5), primary_key=True)
+    first_letter = Column(String(1))
+    second_letter = Column(String(1))
+    third_letter = Column(String(1))
+    fourth_letter = Column(String(1))
+    fifth_letter = Column(String(1))
+    order = Column(Integer(), index=True)
+    # Bit i is set when the word contains the i-th letter of the alphabet, so
+    # that included and unused letters are checked with two bitwise ANDs
+    # instead of a LIKE scan of the word per letter.
+    letter_mask = Column(Integer())
+
+    # A fixed letter finds its words through the index of its position, already
+    # in `order` order, so limited queries stop early without sorting.
+    __table_args__ = tuple(
+        Index(f"ix_words_{position}_letter_order", f"{position}_letter", "order")
+        for position in ("first", "second", "third", "fourth", "fifth")
+    )
+
+
+class IndexInfo(Base):
+    __tablename__ = "index_info"
+    schema_version = Column(Integer(), primary_key=True)
+    word_source_checksum = Column(String(40))
+
+
+def create_words_from_file(word_source_path=WORD_SOURCE_PATH):
+    for word, order in read_words(word_source_path):
+        yield Word(
+            word=word,
+            first_letter=word[0],
+            second_letter=word[1],
+            third_letter=word[2],
+            fourth_letter=word[3],
+            fifth_letter=word[4],
+            order=order,
+            letter_mask=letter_mask(word),
+        )
+
+
+def create_word_rows_from_file(word_source_path=WORD_SOURCE_PATH):
+    for word, order in read_words(word_source_path):
+        yield (word, *word, order, letter_mask(word))
+
+
+class LoadStats(namedtuple("LoadStats", ["rows", "seconds"])):
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def load_database_with_words(
+    engine,
+    word_source_path=WORD_SOURCE_PATH,
+    chunk_size=WORD_INSERT_CHUNK_SIZE,
+):
+    """
+    Insert the words of `word_source_path` with a single prepared INSERT that is
+    executed for chunks of plain row tuples, all in one transaction. The
+    indexes of the table are dropped while loading and built again afterwards,
+    which is faster than updating them row by row, then the statistics the query
+    planner uses to pick indexes are gathered. Return the LoadStats of the load.
+    """
+    insert_words = str(Word.__table__.insert().compile(dialect=engine.dialect))
+    word_rows = create_word_rows_from_file(word_source_path=word_source_path)
+    rows = 0
+    start = time.perf_counter()
+    indexes = Word.__table__.indexes
+    with engine.begin() as connection:
+        for index in indexes:
+            index.drop(connection, checkfirst=True)
+        while True:
+            chunk = list(islice(word_rows, chunk_size))
+            if not chunk:
+                break
+            connection.exec_driver_sql(insert_words, chunk)
+            rows += len(chunk)
+        for index in indexes:
+            index.create(connection)
+        # Sampling is enough for the planner to tell selective indexes apart.
+        connection.exec_driver_sql(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        connection.exec_driver_sql("ANALYZE")
+    return LoadStats(rows=rows, seconds=time.perf_counter() - start)
+
+
+def setup_database(
+    word_db_path=WORD_DB_PATH, threaded=False, word_source_path=WORD_SOURCE_PATH
+):
+    """
+    Return an engine on a word database created at `word_db_path`, in memory by
+    default, and loaded with the words of `word_source_path`. With `threaded`,
+    all threads share one connection, so they see the same in-memory database
+    instead of each getting an empty one.
+    """
+    word_db_url = f"sqlite:///{word_db_path}"
+    if threaded:
+        engine = create_engine(
+            word_db_url,
+            echo=False,
+            future=True,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        engine = create_engine(word_db_url, echo=False, future=True)
+    Base.metadata.create_all(engine)
+    load_database_with_words(engine, word_source_path=word_source_path)
+    return engine
+
+
+def _disable_journaling(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = OFF")
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.close()
+
+
+def build_database(
+    word_db_path=PREBUILT_DB_PATH, word_source_path=WORD_SOURCE_PATH, timer=NULL_TIMER
+):
+    """
+    Build the word database at `word_db_path` and return the LoadStats of
+    loading its words. The database is written to a temporary file first and
+    moved into place, so readers never see a partially built file. That also
+    makes journaling unnecessary while loading.
+    """
+    checksum = word_source_checksum(word_source_path)
+    with atomic_write_path(word_db_path) as build_path:
+        engine = create_engine(f"sqlite:///{build_path}", echo=False, future=True)
+        event.listen(engine, "connect", _disable_journaling)
+        Base.metadata.create_all(engine)
+        with timer.phase("load_database_with_words"):
+            load_stats = load_database_with_words(
+                engine, word_source_path=word_source_path
+            )
+        with Session(engine) as session:
+            session.add(
+                IndexInfo(
+                    schema_version=SCHEMA_VERSION,
+                    word_source_checksum=checksum,
+                )
+            )
+            session.commit()
+        engine.dispose()
+    return load_stats
+
+
+def open_read_only_database(word_db_path=PREBUILT_DB_PATH, pool_size=None):
+    """
+    Return a read-only engine on the word database at `word_db_path`. Each
+    session opens a new connection, unless `pool_size` is given: up to that many
+    connections are then kept open and reused by any thread, one at a time.
+    """
+    word_db_uri = quote(str(Path(word_db_path).resolve()))
+    word_db_url = f"sqlite:///file:{word_db_uri}?mode=ro&uri=true"
+    if pool_size is None:
+        return create_engine(word_db_url, echo=False, future=True)
+    return create_engine(
+        word_db_url,
+        echo=False,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        connect_args={"check_same_thread": False},
+    )
+
+
+def is_database_current(engine, word_source_path=WORD_SOURCE_PATH):
+    try:
+        with Session(engine) as session:
+            index_info = session.query(IndexInfo).first()
+    except DatabaseError:
+        return False
+    return (
+        index_info is not None
+        and index_info.schema_version == SCHEMA_VERSION
+        and index_info.word_source_checksum == word_source_checksum(word_source_path)
+    )
+
+
+def open_database(
+    word_db_path=PREBUILT_DB_PATH,
+    word_source_path=WORD_SOURCE_PATH,
+    pool_size=None,
+    timer=NULL_TIMER,
+):
+    """
+    Return a read-only engine on the prebuilt word database at `word_db_path`,
+    (re)building it first if it is missing, was built by another schema version
+    or from a different word list. Fall back to an in-memory database when the
+    prebuilt database cannot be written. With `pool_size`, the engine can be
+    shared by threads, see `open_read_only_database`.
+    """
+    if os.path.exists(word_db_path):
+        with timer.phase("open database"):
+            engine = open_read_only_database(word_db_path, pool_size=pool_size)
+            is_current = is_database_current(engine, word_source_path=word_source_path)
+        if is_current:
+            return engine
+        engine.dispose()
+    try:
+        with timer.phase("build database"):
+            build_database(word_db_path, word_source_path=word_source_path, timer=timer)
+    except OSError:
+        with timer.phase("setup_database"):
+            return setup_database(
+                threaded=pool_size is not None, word_source_path=word_source_path
+            )
+    with timer.phase("open database"):
+        return open_read_only_database(word_db_path, pool_size=pool_size)
+
+
+def _filter_words(query, constraints):
+    columns = [
+        Word.first_letter,
+        Word.second_letter,
+        Word.third_letter,
+        Word.fourth_letter,
+        Word.fifth_letter,
+    ]
+    for letter_column, letter, not_letters in zip(
+        columns, constraints.letters, constraints.not_letters
+    ):
+        if letter:
+            query = query.filter(letter_column == letter)
+        elif not_letters:
+            query = query.filter(and_(letter_column != l for l in not_letters))
+
+    # LIKE folds ASCII letters, so their mask bits answer "contains" as well.
+    # Anything else, including LIKE wildcards, is still matched with LIKE.
+    required = forbidden = 0
+    for l in constraints.included_letters:
+        bit = letter_bit(like_letter(l) or l)
+        if bit:
+            required |= bit
+        else:
+            query = query.filter(Word.word.contains(l))
+    for ul in constraints.unused_letters or "":
+        bit = letter_bit(like_letter(ul) or ul)
+        if bit:
+            forbidden |= bit
+        else:
+            query = query.filter(~Word.word.contains(ul))
+    if required:
+        query = query.filter(Word.letter_mask.op("&")(required) == required)
+    if forbidden:
+        query = query.filter(Word.letter_mask.op("&")(forbidden) == 0)
+    return query
+
+
+def query_database_for_words(engine, *args, limit=None, timer=NULL_TIMER, **kwargs):
+    """
+    Yield the words matching the constraints, given as the fields of
+    Constraints, in `order` order, at most `limit` of them. Only the word column
+    is selected, and with a `limit` SQLite stops scanning once it has found that
+    many words.
+    """
+    with Session(engine) as session:
+        with timer.phase("query construction"):
+            query = _words_query(session, limit, Constraints(*args, **kwargs))
+        for (word,) in timer.iterate("sqlite execution", query):
+            yield word
+
+
+def _words_query(session, limit, constraints):
+    query = _filter_words(session.query(Word.word), constraints)
+    query = query.order_by(Word.order.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def explain_query_plan(engine, *args, limit=None, **kwargs):
+    """
+    Return the lines of SQLite's EXPLAIN QUERY PLAN for the query that
+    `query_database_for_words` runs with the same arguments, such as
+    "SEARCH words USING INDEX ix_words_first_letter_order (first_letter=?)".
+    """
+    with Session(engine) as session:
+        query = _words_query(session, limit, Constraints(*args, **kwargs))
+        statement = query.statement.compile(dialect=engine.dialect)
+        parameters = tuple(statement.params[name] for name in statement.positiontup)
+        rows = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        return [row.detail for row in rows]
+
+
+def count_database_words(engine, *args, timer=NULL_TIMER, **kwargs):
+    """
+    Return the number of words `query_database_for_words` would yield, counted
+    by SQLite with COUNT(*) rather than fetched.
+    """
+    with Session(engine) as session, timer.phase("sqlite execution"):
+        query = _filter_words(
+            session.query(func.count()).select_from(Word),
+            Constraints(*args, **kwargs),
+        )
+        return query.scalar()
@@ -0,0 +1,127 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+
+DEFAULT_DISK_CACHE_ENTRIES = 10000
+
+# Seconds to wait for another process writing to the cache before giving up on
+# it for this lookup.
+DISK_CACHE_TIMEOUT = 0.5
+
+DISK_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    word_source_checksum TEXT NOT NULL,
+    key TEXT NOT NULL,
+    words TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (word_source_checksum, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def disk_cache_path():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "wordle_helper" / "results.sqlite"
+
+
+class DiskCache:
+    """
+    Query results kept in a SQLite file across runs, keyed by the
+    `canonical_key` of their constraints and by the checksum of the word list
+    they were computed from, so results of a changed word list are never
+    served. Once the cache holds more than `max_entries` results, the least
+    recently used ones are evicted.
+
+    The cache is best effort: when the file cannot be opened or is locked by
+    another process for too long, lookups miss and results are not stored.
+    Threads share one connection, one at a time.
+    """
+
+    def __init__(self, path=None, max_entries=DEFAULT_DISK_CACHE_ENTRIES):
+        self.path = Path(path) if path is not None else disk_cache_path()
+        self.max_entries = max_entries
+        self.connection = None
+        self.lock = Lock()
+
+    def _connect(self):
+        if self.connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=DISK_CACHE_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.executescript(DISK_CACHE_SCHEMA)
+            self.connection = connection
+        return self.connection
+
+    def get(self, word_source_checksum, key):
+        """
+        Return the tuple of words cached for `key` and the word list with
+        `word_source_checksum`, or None.
+        """
+        key = json.dumps(key)
+        try:
+            with self.lock:
+                row = self._get(word_source_checksum, key)
+        except (OSError, sqlite3.Error):
+            return None
+        if row is None:
+            return None
+        return tuple(row[0].split("\n")) if row[0] else ()
+
+    def _get(self, word_source_checksum, key):
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT words FROM results WHERE word_source_checksum = ? AND key = ?",
+            (word_source_checksum, key),
+        ).fetchone()
+        if row is not None:
+            connection.execute(
+                "UPDATE results SET last_used = ? "
+                "WHERE word_source_checksum = ? AND key = ?",
+                (time.time(), word_source_checksum, key),
+            )
+        return row
+
+    def put(self, word_source_checksum, key, words):
+        row = (word_source_checksum, json.dumps(key), "\n".join(words), time.time())
+        try:
+            with self.lock:
+                self._put(row)
+        except (OSError, sqlite3.Error):
+            pass
+
+    def _put(self, row):
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", row
+            )
+            (entries,) = connection.execute("SELECT COUNT(*) FROM results").fetchone()
+            if entries > self.max_entries:
+                connection.execute(
+                    "DELETE FROM results WHERE (word_source_checksum, key) IN ("
+                    "SELECT word_source_checksum, key FROM results "
+                    "ORDER BY last_used LIMIT ?)",
+                    (entries - self.max_entries,),
+                )
+
+    def clear(self):
+        try:
+            with self.lock:
+                self._connect().execute("DELETE FROM results")
+        except (OSError, sqlite3.Error):
+            pass
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,161 @@
+from wordle_helper.bitmaps import CompressedWordIndex, load_word_index
+from wordle_helper.constraints import Constraints
+from wordle_helper.postings import PostingIndex
+from wordle_helper.timing import NULL_TIMER
+from wordle_helper.words import PREBUILT_DB_PATH, WORD_SOURCE_PATH
+
+# Every engine answers the same queries with the same words in the same order,
+# and provides:
+#
+# - `load(word_source_path, **options)`: a classmethod returning the engine for
+#   a word list, ignoring the options it has no use for.
+# - `query(constraints, limit=None)`: an iterator over the words matching the
+#   Constraints `constraints` in word list order, stopping after `limit` words.
+# - `count(constraints)`: the number of matching words.
+# - `len()`: the number of words.
+# - `close()`: release what the engine holds, such as database connections.
+
+
+class IndexEngine:
+    """
+    Engine answering from an in-memory index, which has the `query` and `count`
+    methods of a WordIndex. Each subclass sets `load_index` to the function
+    returning its index for a word list.
+    """
+
+    def __init__(self, index):
+        self.index = index
+
+    @classmethod
+    def load(cls, word_source_path=WORD_SOURCE_PATH, **options):
+        return cls(cls.load_index(word_source_path))
+
+    def query(self, constraints, limit=None):
+        return self.index.query(*constraints, limit=limit)
+
+    def count(self, constraints):
+        return self.index.count(*constraints)
+
+    def __len__(self):
+        return len(self.index.words)
+
+    def close(self):
+        pass
+
+
+class BitsetEngine(IndexEngine):
+    """
+    Integer bitsets per letter and position, or compressed bitmaps for large
+    word lists. The default engine.
+    """
+
+    load_index = staticmethod(load_word_index)
+
+
+class CompressedEngine(IndexEngine):
+    """
+    Compressed, roaring-style bitmaps whatever the size of the word list.
+    """
+
+    load_index = staticmethod(CompressedWordIndex.from_file)
+
+
+class PostingsEngine(IndexEngine):
+    """
+    Sorted posting lists of word ids, fastest for rare letters of large lists.
+    """
+
+    load_index = staticmethod(PostingIndex.from_file)
+
+
+class NumpyEngine(IndexEngine):
+    """
+    Words packed into a NumPy array and matched with whole-array operations.
+    Requires numpy, and word lists of the letters a to z only.
+    """
+
+    @staticmethod
+    def load_index(word_source_path):
+        # Imported here so that numpy is only loaded by this engine.
+        from wordle_helper.packed import PackedWordIndex
+
+        return PackedWordIndex.from_file(word_source_path)
+
+    def __len__(self):
+        return len(self.index)
+
+
+class SQLEngine:
+    """
+    The prebuilt SQLite word database, opened read-only through SQLAlchemy
+    with a pool of up to `pool_size` connections, see `open_database`.
+    """
+
+    def __init__(self, database, timer=NULL_TIMER):
+        self.database = database
+        self.timer = timer
+
+    @classmethod
+    def load(
+        cls,
+        word_source_path=WORD_SOURCE_PATH,
+        word_db_path=PREBUILT_DB_PATH,
+        pool_size=None,
+        timer=NULL_TIMER,
+        **options,
+    ):
+        # Imported here so that the other engines never load SQLAlchemy.
+        from wordle_helper.database import open_database
+
+        database = open_database(
+            word_db_path,
+            word_source_path=word_source_path,
+            pool_size=pool_size,
+            timer=timer,
+        )
+        return cls(database, timer=timer)
+
+    def query(self, constraints, limit=None):
+        from wordle_helper.database import query_database_for_words
+
+        return query_database_for_words(
+            self.database, *constraints, limit=limit, timer=self.timer
+        )
+
+    def count(self, constraints):
+        from wordle_helper.database import count_database_words
+
+        return count_database_words(self.database, *constraints, timer=self.timer)
+
+    def __len__(self):
+        return self.count(Constraints())
+
+    def close(self):
+        self.database.dispose()
+
+
+ENGINES = {
+    "bitset": BitsetEngine,
+    "compressed": CompressedEngine,
+    "postings": PostingsEngine,
+    "numpy": NumpyEngine,
+    "sql": SQLEngine,
+}
+
+
+def engine_class(name):
+    """
+    Return the class of the engine `name` of ENGINES, or raise a ValueError.
+    """
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown engine {name!r}: use one of {', '.join(ENGINES)}")
+
+
+def load_engine(name, word_source_path=WORD_SOURCE_PATH, **options):
+    """
+    Return the engine `name` of ENGINES for the words of `word_source_path`,
+    passing it the `options` of `SQLEngine.load`.
+    """
+    return engine_class(name).load(word_source_path, **options)
@@ -0,0 +1,64 @@
+GREY = 0
+YELLOW = 1
+GREEN = 2
+
+PATTERN_COUNT = 3**5
+ALL_GREEN = PATTERN_COUNT - 1
+
+FEEDBACK_COLOURS = {
+    "g": GREEN,
+    "2": GREEN,
+    "y": YELLOW,
+    "1": YELLOW,
+    ".": GREY,
+    "-": GREY,
+    "x": GREY,
+    "b": GREY,
+    "0": GREY,
+}
+FEEDBACK_LETTERS = {GREEN: "g", YELLOW: "y", GREY: "."}
+
+
+def score_guess(guess, answer):
+    """
+    Return the Wordle feedback for `guess` against `answer` as a pattern code
+    from 0 to 242. Base 3 digit `i` of the code is the colour of letter `i` of
+    the guess: GREY, YELLOW or GREEN. A repeated guess letter is only coloured
+    YELLOW as many times as the answer has unmatched copies of it, from left to
+    right.
+    """
+    colours = [GREY] * 5
+    unmatched = {}
+    for position, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            colours[position] = GREEN
+        else:
+            unmatched[answer_letter] = unmatched.get(answer_letter, 0) + 1
+    for position, guess_letter in enumerate(guess):
+        if colours[position] != GREEN and unmatched.get(guess_letter):
+            colours[position] = YELLOW
+            unmatched[guess_letter] -= 1
+    return sum(colour * 3**position for position, colour in enumerate(colours))
+
+
+def pattern_colours(pattern):
+    return [pattern // 3**position % 3 for position in range(5)]
+
+
+def parse_feedback(feedback):
+    """
+    Return the pattern code of a `feedback` string such as "gy..g", with one
+    character per letter: `g` or `2` for green, `y` or `1` for yellow and any of
+    `.-xb0` for grey. Raise a ValueError for anything else.
+    """
+    feedback = feedback.lower()
+    if len(feedback) != 5 or any(c not in FEEDBACK_COLOURS for c in feedback):
+        raise ValueError(
+            f"Invalid feedback {feedback!r}: use five of g (green), y (yellow) "
+            "and . (grey)"
+        )
+    return sum(FEEDBACK_COLOURS[c] * 3**position for position, c in enumerate(feedback))
+
+
+def format_feedback(pattern):
+    return "".join(FEEDBACK_LETTERS[colour] for colour in pattern_colours(pattern))
@@ -0,0 +1,23 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_write_path(path):
+    """
+    Yield the path of a temporary file next to `path` to write to, then move it
+    into place with mode 0644, so readers never see a partially written file.
+    The temporary file is removed if anything fails.
+    """
+    path = Path(path)
+    fd, build_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        yield build_path
+        os.chmod(build_path, 0o644)
+        os.replace(build_path, path)
+    except BaseException:
+        os.unlink(build_path)
+        raise
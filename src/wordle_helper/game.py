@@ -0,0 +1,37 @@
+class Game:
+    """
+    The words of a WordIndex that are still possible answers after the rounds
+    played so far. Each round narrows the current candidate bitset in place, so
+    a round costs a few bitset operations whatever the number of rounds.
+
+    With a DecisionTree, the game also follows the tree for as long as the
+    guesses played are the ones it suggests.
+    """
+
+    def __init__(self, index, tree=None):
+        self.index = index
+        self.tree = tree
+        self.reset()
+
+    def reset(self):
+        self.candidates = self.index.everything
+        self.node = 0 if self.tree is not None else None
+
+    def play_round(self, guess, pattern):
+        self.candidates &= self.index.matching_feedback(guess, pattern)
+        if self.node is not None:
+            if guess == self.suggestion():
+                self.node = self.tree.next_node(self.node, pattern)
+            else:
+                self.node = None
+
+    def suggestion(self):
+        if self.node is None:
+            return None
+        return self.index.words[self.tree.guesses[self.node]]
+
+    def count(self):
+        return self.index.count_set(self.candidates)
+
+    def words(self):
+        return self.index.words_in(self.candidates)
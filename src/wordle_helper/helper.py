@@ -0,0 +1,171 @@
+from itertools import islice
+from threading import Lock
+
+from wordle_helper.cache import EMPTY_KEY, QueryCache, canonical_key
+from wordle_helper.constraints import CONSTRAINT_FIELDS, Constraints
+from wordle_helper.engines import engine_class, load_engine
+from wordle_helper.timing import NULL_TIMER
+from wordle_helper.words import PREBUILT_DB_PATH, WORD_SOURCE_PATH, word_source_checksum
+
+DEFAULT_POOL_SIZE = 8
+
+
+class WordleHelper:
+    """
+    Answer word queries from one word list loaded once, for embedding in
+    long-running and multithreaded programs. Queries take the constraints of the
+    CLI as keyword arguments, for example::
+
+        helper = WordleHelper()
+        helper.query(first_letter="s", unused_letters="adpiun")
+
+    `engine` names the engine of ENGINES that answers queries, which all give
+    the same results. Instances are safe to use from any number of threads at
+    once: the in-memory indexes are not modified once built, so queries need no
+    locking, and the "sql" engine answers from the prebuilt SQLite database over
+    a pool of up to `pool_size` read-only connections, or a new connection per
+    query with a `pool_size` of None, with one session per query.
+
+    With a `cache_size`, the results of up to that many distinct queries are
+    kept in a QueryCache, keyed so that differently spelled but equivalent
+    constraints share an entry. Cached queries skip the engine entirely.
+
+    With a `disk_cache`, a DiskCache, results are also kept across runs. The
+    index or database is then only loaded by the first query the caches miss,
+    so a run whose queries are all on disk never builds it.
+
+    With a `timer`, a PhaseTimer, the time spent loading, querying and looking
+    up caches is recorded per phase, for services to export.
+    """
+
+    def __init__(
+        self,
+        engine="bitset",
+        word_source_path=WORD_SOURCE_PATH,
+        word_db_path=PREBUILT_DB_PATH,
+        pool_size=DEFAULT_POOL_SIZE,
+        cache_size=0,
+        disk_cache=None,
+        timer=NULL_TIMER,
+    ):
+        # Check the name now, since the engine itself may be loaded lazily.
+        engine_class(engine)
+        self.engine_name = engine
+        self.word_source_path = word_source_path
+        self.word_db_path = word_db_path
+        self.pool_size = pool_size
+        self.cache = QueryCache(cache_size) if cache_size else None
+        self.disk_cache = disk_cache
+        self.timer = timer
+        self.checksum = None
+        if disk_cache is not None:
+            self.checksum = word_source_checksum(word_source_path)
+        self.engine = None
+        self.load_lock = Lock()
+        if disk_cache is None:
+            self._load()
+
+    def _load(self):
+        """
+        Load the engine, once.
+        """
+        if self.engine is not None:
+            return
+        with self.load_lock:
+            if self.engine is not None:
+                return
+            with self.timer.phase("load"):
+                self.engine = load_engine(
+                    self.engine_name,
+                    self.word_source_path,
+                    word_db_path=self.word_db_path,
+                    pool_size=self.pool_size,
+                    timer=self.timer,
+                )
+
+    def iter(self, limit=None, **constraints):
+        """
+        Return an iterator over the words matching `constraints`, in word list
+        order, stopping after `limit` words. With the sql engine and no cache,
+        the iterator holds a pooled connection until it is exhausted or closed.
+        """
+        if self.cache is not None or self.disk_cache is not None:
+            # Caches keep whole results, so that any limit can be served later.
+            return islice(self._cached_words(constraints), limit)
+        return self._query_engine(constraints, limit=limit)
+
+    def query(self, limit=None, **constraints):
+        """
+        Return the list of words matching `constraints`, in word list order, at
+        most `limit` of them.
+        """
+        return list(self.iter(limit=limit, **constraints))
+
+    def count(self, **constraints):
+        """
+        Return the number of words matching `constraints`.
+        """
+        constraints = _constraints(constraints)
+        if self.cache is not None or self.disk_cache is not None:
+            # A miss is counted by the engine rather than fetching every word.
+            with self.timer.phase("cache"):
+                words = self._cache_lookup(canonical_key(constraints))
+            if words is not None:
+                return len(words)
+        self._load()
+        with self.timer.phase("query"):
+            return self.engine.count(constraints)
+
+    def _query_engine(self, constraints, limit=None):
+        constraints = _constraints(constraints)
+        self._load()
+        return self.timer.iterate("query", self.engine.query(constraints, limit=limit))
+
+    def _cached_words(self, constraints):
+        with self.timer.phase("cache"):
+            return self._cached_words_or_query(constraints)
+
+    def _cache_lookup(self, key):
+        """
+        Return the words cached for `key` in memory or on disk, or None.
+        """
+        if key == EMPTY_KEY:
+            return ()
+        if self.cache is not None:
+            words = self.cache.get(key)
+            if words is not None:
+                return words
+        if self.disk_cache is not None:
+            words = self.disk_cache.get(self.checksum, key)
+            if words is not None and self.cache is not None:
+                self.cache.put(key, words)
+            return words
+        return None
+
+    def _cached_words_or_query(self, constraints):
+        key = canonical_key(_constraints(constraints))
+        words = self._cache_lookup(key)
+        if words is None:
+            words = tuple(self._query_engine(constraints))
+            if self.disk_cache is not None:
+                self.disk_cache.put(self.checksum, key, words)
+            if self.cache is not None:
+                self.cache.put(key, words)
+        return words
+
+    def __len__(self):
+        self._load()
+        return len(self.engine)
+
+    def close(self):
+        if self.engine is not None:
+            self.engine.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+
+def _constraints(constraints):
+    unknown = set(constraints) - set(CONSTRAINT_FIELDS)
+    if unknown:
+        raise TypeError(f"Unknown constraints: {', '.join(sorted(unknown))}")
+    return Constraints(**constraints)
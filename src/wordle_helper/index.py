@@ -0,0 +1,166 @@
+from collections import Counter, defaultdict
+from itertools import islice
+
+from wordle_helper.constraints import Constraints
+from wordle_helper.feedback import GREEN, GREY, YELLOW, pattern_colours
+from wordle_helper.words import WORD_SOURCE_PATH, like_letter, read_words
+
+# Bit offsets set in each possible byte value, used to walk a bitset without
+# shifting the whole integer once per word.
+_BYTE_BITS = tuple(tuple(i for i in range(8) if byte >> i & 1) for byte in range(256))
+
+
+def make_bitset(ids, size):
+    data = bytearray((size + 7) // 8)
+    for i in ids:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, "little")
+
+
+def full_bitset(size):
+    return (1 << size) - 1
+
+
+if hasattr(int, "bit_count"):
+    count_bitset = int.bit_count
+else:  # Python < 3.10
+
+    def count_bitset(bits):
+        return bin(bits).count("1")
+
+
+def iter_bitset(bits):
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset * 8
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+class WordIndex:
+    """
+    In-memory word index that answers `query_database_for_words` queries with
+    precomputed bitsets. Bit `i` of every set stands for `words[i]`, and words
+    are kept in `order` order, so walking a result bitset yields words in the
+    same order as the SQL query.
+    """
+
+    # How the sets of word ids are built and read, so that subclasses can store
+    # them differently. Sets only need to support `&`, `a & ~b` and the
+    # functions below.
+    empty = 0
+    make_set = staticmethod(make_bitset)
+    full_set = staticmethod(full_bitset)
+    iter_set = staticmethod(iter_bitset)
+    count_set = staticmethod(count_bitset)
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        size = len(self.words)
+        letter_at_ids = [defaultdict(list) for _ in range(5)]
+        letter_count_ids = defaultdict(list)
+        for i, word in enumerate(self.words):
+            for position, letter in enumerate(word):
+                letter_at_ids[position][letter].append(i)
+            for letter, count in Counter(word).items():
+                for at_least in range(1, count + 1):
+                    letter_count_ids[letter, at_least].append(i)
+
+        self.everything = self.full_set(size)
+        self.letter_at = [
+            {letter: self.make_set(ids, size) for letter, ids in position_ids.items()}
+            for position_ids in letter_at_ids
+        ]
+        # Words with at least `count` copies of `letter`, keyed by
+        # (letter, count).
+        self.letter_at_least = {
+            key: self.make_set(ids, size) for key, ids in letter_count_ids.items()
+        }
+        self.letter_in = {
+            letter: bits
+            for (letter, count), bits in self.letter_at_least.items()
+            if count == 1
+        }
+
+    @classmethod
+    def from_file(cls, word_source_path=WORD_SOURCE_PATH):
+        return cls(word for word, _order in read_words(word_source_path))
+
+    def containing(self, letter):
+        letter = like_letter(letter)
+        if letter is None:
+            return self.everything
+        return self.letter_in.get(letter, self.empty)
+
+    def select(self, constraints):
+        """
+        Return the set of the ids of the words matching the Constraints
+        `constraints`.
+        """
+        candidates = self.everything
+
+        for position, (letter, not_letters) in enumerate(
+            zip(constraints.letters, constraints.not_letters)
+        ):
+            letter_at = self.letter_at[position]
+            if letter:
+                candidates &= letter_at.get(letter, self.empty)
+            else:
+                for l in not_letters:
+                    candidates &= ~letter_at.get(l, self.empty)
+
+        for l in constraints.included_letters:
+            candidates &= self.containing(l)
+
+        for ul in constraints.unused_letters or "":
+            candidates &= ~self.containing(ul)
+
+        return candidates
+
+    def matching_feedback(self, guess, pattern):
+        """
+        Return the bitset of the words that give the feedback `pattern` to
+        `guess`, that is the words for which `score_guess(guess, word)` is
+        `pattern`.
+        """
+        candidates = self.everything
+        coloured = Counter()
+        greyed = set()
+        for position, (letter, colour) in enumerate(
+            zip(guess, pattern_colours(pattern))
+        ):
+            letter_at = self.letter_at[position].get(letter, self.empty)
+            if colour == GREEN:
+                candidates &= letter_at
+                coloured[letter] += 1
+                continue
+            candidates &= ~letter_at
+            if colour == YELLOW:
+                if letter in greyed:
+                    # Copies of a letter turn yellow from left to right, so
+                    # no answer can give a yellow after a grey.
+                    return self.empty
+                coloured[letter] += 1
+            elif colour == GREY:
+                greyed.add(letter)
+
+        for letter in set(guess):
+            count = coloured[letter]
+            if count:
+                candidates &= self.letter_at_least.get((letter, count), self.empty)
+            if letter in greyed:
+                candidates &= ~self.letter_at_least.get((letter, count + 1), self.empty)
+        return candidates
+
+    def words_in(self, bits):
+        words = self.words
+        for i in self.iter_set(bits):
+            yield words[i]
+
+    def query(self, *args, limit=None, **kwargs):
+        constraints = Constraints(*args, **kwargs)
+        return islice(self.words_in(self.select(constraints)), limit)
+
+    def count(self, *args, **kwargs):
+        return self.count_set(self.select(Constraints(*args, **kwargs)))
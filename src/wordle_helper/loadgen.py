@@ -0,0 +1,85 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlencode, urlsplit
+
+from wordle_helper.constraints import constraints_from_feedback
+from wordle_helper.feedback import score_guess
+
+
+def sample_queries(words, count, seed=0):
+    """
+    Return `count` realistic `/words` request targets: the constraints a player
+    would type after one to three random guesses against a random answer.
+    """
+    rng = random.Random(seed)
+    targets = []
+    for _ in range(count):
+        answer = rng.choice(words)
+        guesses = rng.sample(words, rng.randint(1, 3))
+        constraints = constraints_from_feedback(
+            (guess, score_guess(guess, answer)) for guess in guesses
+        )
+        query = urlencode({k: v for k, v in constraints.items() if v is not None})
+        targets.append(f"/words?{query}")
+    return targets
+
+
+async def _run_client(host, port, targets, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for target in targets:
+            start = time.perf_counter()
+            writer.write(
+                f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1")
+            )
+            await writer.drain()
+            content_length = 0
+            status_line = await reader.readline()
+            if not status_line.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(f"Unexpected response: {status_line!r}")
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    content_length = int(value)
+            await reader.readexactly(content_length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def generate_load(url, targets, concurrency):
+    """
+    Send the `targets` requests to the server at `url` over `concurrency`
+    keep-alive connections and return (seconds, latencies).
+    """
+    location = urlsplit(url)
+    host = location.hostname or "127.0.0.1"
+    port = location.port or 80
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _run_client(host, port, targets[i::concurrency], latencies)
+            for i in range(concurrency)
+        )
+    )
+    return time.perf_counter() - start, latencies
+
+
+def summarize_load(seconds, latencies):
+    latencies = sorted(latencies)
+    count = len(latencies)
+
+    def percentile(fraction):
+        return latencies[min(count - 1, int(fraction * count))] * 1000
+
+    yield f"Requests: {count} in {seconds:.2f}s ({count / seconds:,.0f} requests/s)"
+    if latencies:
+        yield (
+            f"Latency: p50 {percentile(0.5):.2f}ms, p90 {percentile(0.9):.2f}ms, "
+            f"p99 {percentile(0.99):.2f}ms, max {latencies[-1] * 1000:.2f}ms"
+        )
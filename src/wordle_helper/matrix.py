@@ -0,0 +1,87 @@
+from pathlib import Path
+
+from wordle_helper.feedback import GREEN, YELLOW
+from wordle_helper.files import atomic_write_path
+from wordle_helper.optional import np, require_numpy
+from wordle_helper.words import WORD_SOURCE_PATH, read_words, word_source_checksum
+
+FEEDBACK_MATRIX_CHUNK_SIZE = 256
+
+
+def build_feedback_matrix(words, chunk_size=FEEDBACK_MATRIX_CHUNK_SIZE):
+    """
+    Return the N x N uint8 matrix of `score_guess(words[guess], words[answer])`
+    pattern codes, computed a chunk of guess rows at a time.
+    """
+    require_numpy("The feedback matrix")
+    letters = np.array(list(words), dtype="<U5").reshape(-1, 1).view(np.uint32)
+    answers = letters.T
+    size = len(letters)
+    matrix = np.empty((size, size), dtype=np.uint8)
+
+    for start in range(0, size, chunk_size):
+        guesses = letters[start : start + chunk_size]
+        # same[p][q]: whether guess letter p equals answer letter q.
+        same = [
+            [guesses[:, p, None] == answers[None, q] for q in range(5)]
+            for p in range(5)
+        ]
+        green = [same[p][p] for p in range(5)]
+        codes = np.zeros((len(guesses), size), dtype=np.uint8)
+        for p in range(5):
+            codes[green[p]] += GREEN * 3**p
+            available = sum((same[p][q] & ~green[q]).astype(np.uint8) for q in range(5))
+            # Earlier non-green copies of the same guess letter use up the
+            # unmatched copies in the answer first.
+            used = np.zeros_like(codes)
+            for earlier in range(p):
+                repeated = guesses[:, earlier, None] == guesses[:, p, None]
+                used += (repeated & ~green[earlier]).astype(np.uint8)
+            codes[~green[p] & (available > used)] += YELLOW * 3**p
+        matrix[start : start + len(guesses)] = codes
+    return matrix
+
+
+def feedback_matrix_path(word_source_path=WORD_SOURCE_PATH):
+    """
+    Return the path of the feedback matrix of `word_source_path`. The path
+    carries the checksum of the word list, so a changed list never reuses a
+    stale matrix.
+    """
+    word_source_path = Path(word_source_path)
+    checksum = word_source_checksum(word_source_path)
+    return word_source_path.with_name(
+        f"{word_source_path.stem}.{checksum[:16]}.patterns.npy"
+    )
+
+
+def save_feedback_matrix(matrix, matrix_path):
+    with atomic_write_path(matrix_path) as build_path, open(build_path, "wb") as f:
+        np.save(f, matrix)
+
+
+def load_feedback_matrix(matrix_path):
+    """
+    Return the feedback matrix at `matrix_path` memory-mapped read-only, so
+    processes loading the same file share its pages instead of each holding a
+    copy.
+    """
+    require_numpy("The feedback matrix")
+    return np.load(matrix_path, mmap_mode="r")
+
+
+def get_feedback_matrix(word_source_path=WORD_SOURCE_PATH):
+    """
+    Return the memory-mapped feedback matrix of `word_source_path`, building
+    and saving it first if needed. Fall back to an in-memory matrix when it
+    cannot be saved.
+    """
+    matrix_path = feedback_matrix_path(word_source_path)
+    if not matrix_path.exists():
+        words = [word for word, _order in read_words(word_source_path)]
+        matrix = build_feedback_matrix(words)
+        try:
+            save_feedback_matrix(matrix, matrix_path)
+        except OSError:
+            return matrix
+    return load_feedback_matrix(matrix_path)
@@ -0,0 +1,15 @@
+# numpy is an optional dependency: modules using it import `np` from here, which
+# is None when numpy is not installed.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def require_numpy(feature):
+    """
+    Raise an ImportError explaining how to install numpy if it is missing, for
+    the `feature` that needs it.
+    """
+    if np is None:
+        raise ImportError(f"{feature} requires numpy: pip install wordle_helper[numpy]")
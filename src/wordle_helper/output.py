@@ -0,0 +1,83 @@
+import json
+
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+OUTPUT_FORMATS = ("plain", "ndjson", "csv", "json")
+
+CSV_SPECIAL_CHARACTERS = frozenset(',"\r\n')
+
+
+def write_text(chunks, output, buffer_size=OUTPUT_BUFFER_SIZE):
+    """
+    Write the `chunks` of text to the binary `output` stream, encoded as UTF-8
+    in blocks of about `buffer_size` characters rather than one write per chunk.
+    """
+    block = []
+    block_size = 0
+    for chunk in chunks:
+        block.append(chunk)
+        block_size += len(chunk)
+        if block_size >= buffer_size:
+            output.write("".join(block).encode("utf-8"))
+            block = []
+            block_size = 0
+    if block:
+        output.write("".join(block).encode("utf-8"))
+    output.flush()
+
+
+def _csv_field(value):
+    if CSV_SPECIAL_CHARACTERS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _csv_lines(header, values):
+    yield header + "\n"
+    for value in values:
+        yield _csv_field(value) + "\n"
+
+
+def _json_array(items):
+    yield "["
+    for i, item in enumerate(items):
+        yield ", " + item if i else item
+    yield "]\n"
+
+
+def format_words(words, output_format="plain"):
+    """
+    Return the chunks of text of `words` in `output_format`:
+
+    - "plain": one word per line
+    - "ndjson": one {"word": ...} JSON object per line
+    - "csv": a "word" header line, then one word per line
+    - "json": a single JSON array of the words
+    """
+    if output_format == "plain":
+        return (word + "\n" for word in words)
+    if output_format == "ndjson":
+        return ('{"word": ' + json.dumps(word) + "}\n" for word in words)
+    if output_format == "csv":
+        return _csv_lines("word", words)
+    if output_format == "json":
+        return _json_array(json.dumps(word) for word in words)
+    raise ValueError(f"Unknown output format {output_format!r}")
+
+
+def format_count(count, output_format="plain"):
+    """
+    Return the text of a word `count` in `output_format`, as a single JSON
+    object {"count": ...} for "ndjson" and "json".
+    """
+    if output_format == "plain":
+        return f"{count}\n"
+    if output_format in ("ndjson", "json"):
+        return json.dumps({"count": count}) + "\n"
+    if output_format == "csv":
+        return f"count\n{count}\n"
+    raise ValueError(f"Unknown output format {output_format!r}")
+
+
+def write_words(words, output, output_format="plain", buffer_size=OUTPUT_BUFFER_SIZE):
+    write_text(format_words(words, output_format), output, buffer_size=buffer_size)
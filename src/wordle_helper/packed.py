@@ -0,0 +1,153 @@
+from wordle_helper.constraints import Constraints
+from wordle_helper.optional import np, require_numpy
+from wordle_helper.words import WORD_SOURCE_PATH, like_letter, read_words
+
+LETTER_BITS = 5
+LETTER_MASK = (1 << LETTER_BITS) - 1
+POSITION_SHIFTS = tuple(LETTER_BITS * position for position in range(5))
+
+
+def encode_letter(letter):
+    """
+    Return the 1-26 code of an `a`-`z` letter, or None for anything else. Code
+    0 is never used, so an empty 5 bit field cannot be mistaken for `a`.
+    """
+    if len(letter) == 1 and "a" <= letter <= "z":
+        return ord(letter) - ord("a") + 1
+    return None
+
+
+def encode_word(word):
+    code = 0
+    for shift, letter in zip(POSITION_SHIFTS, word):
+        letter_code = encode_letter(letter)
+        if letter_code is None:
+            raise ValueError(f"Cannot pack {word!r}: only a-z letters are supported")
+        code |= letter_code << shift
+    return code
+
+
+def decode_word(code):
+    return "".join(
+        chr((code >> shift & LETTER_MASK) + ord("a") - 1) for shift in POSITION_SHIFTS
+    )
+
+
+class PackedWordIndex:
+    """
+    Word index that stores every word as one uint32, 5 bits per position, in a
+    contiguous array kept in `order` order, alongside a uint32 of letter
+    presence bits per word. Queries are whole-array mask and compare operations
+    with no Python loop over words.
+    """
+
+    def __init__(self, words):
+        require_numpy("PackedWordIndex")
+        words = np.array(list(words), dtype="<U5")
+        letters = words.reshape(-1, 1).view(np.uint32)
+        letters = letters.astype(np.int64) - (ord("a") - 1)
+        if letters.size and (letters.min() < 1 or letters.max() > 26):
+            raise ValueError("Cannot pack words: only a-z letters are supported")
+        shifts = np.array(POSITION_SHIFTS, dtype=np.int64)
+        self.codes = np.ascontiguousarray(
+            (letters << shifts).sum(axis=1), dtype=np.uint32
+        )
+        # Bit `code` is set for every letter in the word. Deriving these bits
+        # per query would take five extra passes over the array, so they are
+        # kept next to the packed words.
+        self.letter_presence = np.bitwise_or.reduce(
+            np.uint32(1) << letters.astype(np.uint32), axis=1
+        )
+
+    @classmethod
+    def from_file(cls, word_source_path=WORD_SOURCE_PATH):
+        return cls(word for word, _order in read_words(word_source_path))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def match(self, constraints):
+        """
+        Return a boolean array telling which words of `codes` match the
+        Constraints `constraints`.
+        """
+        nothing = np.zeros(len(self.codes), dtype=bool)
+
+        fixed_mask = fixed_value = 0
+        excluded = []
+        for shift, letter, not_letters in zip(
+            POSITION_SHIFTS, constraints.letters, constraints.not_letters
+        ):
+            if letter:
+                letter_code = encode_letter(letter)
+                if letter_code is None:
+                    return nothing
+                fixed_mask |= LETTER_MASK << shift
+                fixed_value |= letter_code << shift
+            else:
+                for l in not_letters:
+                    letter_code = encode_letter(l)
+                    if letter_code is not None:
+                        excluded.append((LETTER_MASK << shift, letter_code << shift))
+
+        required = forbidden = 0
+        for l in constraints.included_letters:
+            l = like_letter(l)
+            if l is None:
+                continue
+            letter_code = encode_letter(l)
+            if letter_code is None:
+                return nothing
+            required |= 1 << letter_code
+        for ul in constraints.unused_letters or "":
+            ul = like_letter(ul)
+            if ul is None:
+                return nothing
+            letter_code = encode_letter(ul)
+            if letter_code is not None:
+                forbidden |= 1 << letter_code
+
+        codes = self.codes
+        presence = self.letter_presence
+        conditions = []
+        if fixed_mask:
+            conditions.append((codes & np.uint32(fixed_mask)) == np.uint32(fixed_value))
+        for excluded_mask, excluded_value in excluded:
+            conditions.append(
+                (codes & np.uint32(excluded_mask)) != np.uint32(excluded_value)
+            )
+        if required:
+            conditions.append((presence & np.uint32(required)) == np.uint32(required))
+        if forbidden:
+            conditions.append((presence & np.uint32(forbidden)) == 0)
+
+        if not conditions:
+            return np.ones(len(codes), dtype=bool)
+        selected = conditions[0]
+        for condition in conditions[1:]:
+            selected &= condition
+        return selected
+
+    def select(self, constraints):
+        """
+        Return the sorted array of the positions in `codes` of the words that
+        match the Constraints `constraints`.
+        """
+        return np.flatnonzero(self.match(constraints))
+
+    def words_at(self, ids):
+        codes = self.codes[ids].reshape(-1, 1)
+        letters = (codes >> np.array(POSITION_SHIFTS, dtype=np.uint32)) & np.uint32(
+            LETTER_MASK
+        )
+        letters = np.ascontiguousarray(letters + np.uint32(ord("a") - 1))
+        return letters.view("<U5").ravel().tolist()
+
+    def query(self, *args, limit=None, **kwargs):
+        ids = self.select(Constraints(*args, **kwargs))
+        if limit is not None:
+            ids = ids[:limit]
+        return iter(self.words_at(ids))
+
+    def count(self, *args, **kwargs):
+        return int(np.count_nonzero(self.match(Constraints(*args, **kwargs))))
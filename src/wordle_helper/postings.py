@@ -0,0 +1,157 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import islice
+
+from wordle_helper.constraints import Constraints
+from wordle_helper.words import WORD_SOURCE_PATH, like_letter, read_words
+
+EMPTY_POSTINGS = array("I")
+
+
+def gallop(postings, target, low):
+    """
+    Return the index of the first id of the sorted `postings` at or after `low`
+    that is not less than `target`. The search probes 1, 2, 4... ids ahead of
+    `low` before bisecting, so it costs the log of the distance skipped rather
+    than of the whole list.
+    """
+    size = len(postings)
+    step = 1
+    high = low
+    while high < size and postings[high] < target:
+        low = high + 1
+        high += step
+        step *= 2
+    return bisect_left(postings, target, low, min(high, size))
+
+
+def intersect(ids, postings):
+    """
+    Return the ids of the sorted `ids` that are also in the sorted `postings`,
+    galloping through `postings`, which should be the longer of the two.
+    """
+    result = []
+    position = 0
+    size = len(postings)
+    for i in ids:
+        position = gallop(postings, i, position)
+        if position == size:
+            break
+        if postings[position] == i:
+            result.append(i)
+    return result
+
+
+class PostingIndex:
+    """
+    Inverted word index that answers `query_database_for_words` queries from
+    sorted posting lists of word ids, where `words[i]` has id `i` and words are
+    kept in `order` order.
+
+    The lists of the letters a query requires are intersected from the shortest
+    up, galloping through each longer list. Excluded letters are then checked
+    on the words of the remaining ids, since their lists are long: a vowel is in
+    about half the words. A query therefore costs time proportional to its
+    rarest required list, such as the words starting with x, rather than to the
+    size of the dictionary. Only queries without any required letter walk every
+    word.
+    """
+
+    def __init__(self, words):
+        self.words = tuple(words)
+        letter_at_ids = [defaultdict(list) for _ in range(5)]
+        letter_ids = defaultdict(list)
+        for i, word in enumerate(self.words):
+            for position, letter in enumerate(word):
+                letter_at_ids[position][letter].append(i)
+            for letter in set(word):
+                letter_ids[letter].append(i)
+
+        self.letter_at = [
+            {letter: array("I", ids) for letter, ids in position_ids.items()}
+            for position_ids in letter_at_ids
+        ]
+        self.letter_in = {letter: array("I", ids) for letter, ids in letter_ids.items()}
+
+    @classmethod
+    def from_file(cls, word_source_path=WORD_SOURCE_PATH):
+        return cls(word for word, _order in read_words(word_source_path))
+
+    def containing(self, letter):
+        """
+        Return the posting list of the words containing `letter` the way LIKE
+        matches it, or None for a wildcard, which every word contains.
+        """
+        letter = like_letter(letter)
+        if letter is None:
+            return None
+        return self.letter_in.get(letter, EMPTY_POSTINGS)
+
+    def iter_ids(self, constraints):
+        """
+        Return an iterator over the ids of the words matching the Constraints
+        `constraints`, in increasing order. Words are checked against excluded letters as the iterator
+        advances, so a limited query stops checking once it has enough.
+        """
+        required = []
+        excluded_at = []
+
+        for position, (letter, not_letters) in enumerate(
+            zip(constraints.letters, constraints.not_letters)
+        ):
+            if letter:
+                required.append(self.letter_at[position].get(letter, EMPTY_POSTINGS))
+            elif not_letters:
+                excluded_at.append((position, set(not_letters)))
+
+        for l in constraints.included_letters:
+            postings = self.containing(l)
+            if postings is not None:
+                required.append(postings)
+
+        unused = set()
+        for ul in constraints.unused_letters or "":
+            ul = like_letter(ul)
+            if ul is None:
+                return iter(())
+            unused.add(ul)
+
+        if required:
+            required.sort(key=len)
+            ids = required[0]
+            for postings in required[1:]:
+                if not ids:
+                    return iter(())
+                ids = intersect(ids, postings)
+        else:
+            ids = range(len(self.words))
+
+        if not excluded_at and not unused:
+            return iter(ids)
+        words = self.words
+        return (
+            i
+            for i in ids
+            if unused.isdisjoint(words[i])
+            and not any(words[i][p] in letters for p, letters in excluded_at)
+        )
+
+    def select(self, constraints):
+        """
+        Return the sorted list of the ids of the words matching the Constraints
+        `constraints`.
+        """
+        return list(self.iter_ids(constraints))
+
+    def words_in(self, ids):
+        words = self.words
+        for i in ids:
+            yield words[i]
+
+    def query(self, *args, limit=None, **kwargs):
+        ids = self.iter_ids(Constraints(*args, **kwargs))
+        return self.words_in(islice(ids, limit))
+
+    def count(self, *args, **kwargs):
+        return len(self.select(Constraints(*args, **kwargs)))
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+from wordle_helper.constraints import parse_constraints
+from wordle_helper.timing import NULL_TIMER
+
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8080
+SERVE_BACKLOG = 1024
+MAX_REQUEST_BODY_SIZE = 1 << 16
+MAX_HEADER_LINES = 100
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class QueryServer:
+    """
+    Minimal HTTP/1.1 JSON server answering word queries from one shared, already
+    loaded WordleHelper. Connections are kept alive, and queries are answered
+    directly on the event loop since they take microseconds.
+
+    Endpoints, taking the CLI option names as query string parameters or as a
+    JSON object body for POST:
+
+    - `/words`: {"count": ..., "words": [...]}
+    - `/count`: {"count": ...}
+    - `/health`: {"status": "ok", "words": <dictionary size>}, with the "cache"
+      statistics of the helper when it has a cache, and the "timings" of its
+      phases when it has a timer
+    """
+
+    def __init__(self, helper):
+        self.helper = helper
+
+    def respond(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/health":
+            health = {"status": "ok", "words": len(self.helper)}
+            if self.helper.cache is not None:
+                health["cache"] = self.helper.cache.stats()._asdict()
+            if self.helper.timer is not NULL_TIMER:
+                health["timings"] = self.helper.timer.stats()
+            return health
+        if url.path not in ("/words", "/count"):
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown endpoint {url.path}")
+
+        if method == "GET":
+            request = dict(parse_qsl(url.query))
+        elif method == "POST":
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+            if not isinstance(request, dict):
+                raise HTTPError(
+                    HTTPStatus.BAD_REQUEST, "Expected a JSON object of constraints"
+                )
+        else:
+            raise HTTPError(
+                HTTPStatus.METHOD_NOT_ALLOWED, f"Unsupported method {method}"
+            )
+        try:
+            constraints = parse_constraints(request)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+
+        if url.path == "/count":
+            return {"count": self.helper.count(**constraints)}
+        words = self.helper.query(**constraints)
+        return {"count": len(words), "words": words}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                # Lines longer than the stream limit make readline raise a
+                # ValueError, after which the connection cannot be resynced.
+                try:
+                    request_line = await reader.readline()
+                except ValueError:
+                    await write_error(
+                        writer, HTTPStatus.BAD_REQUEST, "Request line too long"
+                    )
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                try:
+                    headers = await read_headers(reader)
+                except HTTPError as e:
+                    await write_error(writer, e.status, str(e))
+                    break
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                try:
+                    body_size = int(headers.get("content-length", 0))
+                except ValueError:
+                    body_size = None
+                try:
+                    if body_size is None or body_size < 0:
+                        keep_alive = False
+                        raise HTTPError(
+                            HTTPStatus.BAD_REQUEST, "Invalid Content-Length"
+                        )
+                    if body_size > MAX_REQUEST_BODY_SIZE:
+                        keep_alive = False
+                        raise HTTPError(
+                            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            "Request body too large",
+                        )
+                    body = await reader.readexactly(body_size) if body_size else b""
+                    status = HTTPStatus.OK
+                    payload = self.respond(method, target, body)
+                except HTTPError as e:
+                    status = e.status
+                    payload = {"error": str(e)}
+                except Exception:
+                    # The request was read in full, so the connection can go on
+                    # with the next one.
+                    logger.exception("Failed to answer %s %s", method, target)
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    payload = {"error": "Internal server error"}
+
+                await write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_headers(reader):
+    """
+    Return the headers of a request by lowercase name. Raise an HTTPError for
+    a line longer than the stream limit or more than MAX_HEADER_LINES lines.
+    """
+    headers = {}
+    for _ in range(MAX_HEADER_LINES + 1):
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request header too long"
+            )
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raise HTTPError(
+        HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many request headers"
+    )
+
+
+async def write_response(writer, status, payload, keep_alive):
+    content = json.dumps(payload).encode("utf-8")
+    writer.write(
+        (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(content)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        + content
+    )
+    await writer.drain()
+
+
+async def write_error(writer, status, message):
+    await write_response(writer, status, {"error": message}, keep_alive=False)
+
+
+async def serve(helper, host=SERVE_HOST, port=SERVE_PORT):
+    query_server = QueryServer(helper)
+    server = await asyncio.start_server(
+        query_server.handle_connection, host, port, backlog=SERVE_BACKLOG
+    )
+    async with server:
+        await server.serve_forever()
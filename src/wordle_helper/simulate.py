@@ -0,0 +1,215 @@
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from wordle_helper.feedback import score_guess
+from wordle_helper.index import WordIndex, iter_bitset
+from wordle_helper.matrix import get_feedback_matrix
+from wordle_helper.solver import rank_guesses
+from wordle_helper.tree import decision_tree_path, load_decision_tree
+from wordle_helper.words import WORD_SOURCE_PATH, read_words
+
+MAX_GUESSES = 6
+
+# Games still unsolved after this many guesses are given up on, so a strategy
+# that stops making progress cannot hang a simulation.
+MAX_TURNS = 20
+
+SIMULATION_CHUNK_SIZE = 100
+
+
+class FirstCandidateStrategy:
+    """
+    Guess the first word, in `order` order, that can still be the answer.
+    """
+
+    def __init__(self, index, word_source_path=WORD_SOURCE_PATH):
+        self.index = index
+
+    def start_game(self):
+        pass
+
+    def next_guess(self, candidates, pattern):
+        return (candidates & -candidates).bit_length() - 1
+
+
+class EntropyStrategy:
+    """
+    Guess the word that gives the most information about the candidates, using
+    the feedback matrix. Guesses are cached per candidate set, since many games
+    go through the same sets.
+    """
+
+    def __init__(self, index, word_source_path=WORD_SOURCE_PATH):
+        self.index = index
+        self.matrix = get_feedback_matrix(word_source_path)
+        self.guesses = {}
+
+    def start_game(self):
+        pass
+
+    def next_guess(self, candidates, pattern):
+        guess_id = self.guesses.get(candidates)
+        if guess_id is None:
+            candidate_ids = list(iter_bitset(candidates))
+            if len(candidate_ids) <= 2:
+                guess_id = candidate_ids[0]
+            else:
+                guess_id, _entropy = rank_guesses(self.matrix, candidate_ids, top=1)[0]
+            self.guesses[candidates] = guess_id
+        return guess_id
+
+
+class TreeStrategy:
+    """
+    Walk the decision tree built by `wordle_helper build-tree`, so each move is
+    a lookup of the feedback pattern among the children of the current node.
+    """
+
+    def __init__(self, index, word_source_path=WORD_SOURCE_PATH):
+        self.index = index
+        self.tree = load_decision_tree(
+            decision_tree_path(word_source_path), word_source_path=word_source_path
+        )
+        self.fallback = FirstCandidateStrategy(index, word_source_path)
+        self.node = None
+
+    def start_game(self):
+        self.node = 0
+
+    def next_guess(self, candidates, pattern):
+        if pattern is not None and self.node is not None:
+            self.node = self.tree.next_node(self.node, pattern)
+        if self.node is None:
+            return self.fallback.next_guess(candidates, pattern)
+        return self.tree.guesses[self.node]
+
+
+STRATEGIES = {
+    "first": FirstCandidateStrategy,
+    "entropy": EntropyStrategy,
+    "tree": TreeStrategy,
+}
+
+
+def play_game(index, strategy, answer_id):
+    """
+    Return the number of guesses `strategy` needs to find the word of
+    `answer_id`, or None if it gives up after MAX_TURNS guesses.
+    """
+    answer = index.words[answer_id]
+    candidates = index.everything
+    pattern = None
+    strategy.start_game()
+    for turn in range(1, MAX_TURNS + 1):
+        guess_id = strategy.next_guess(candidates, pattern)
+        if guess_id == answer_id:
+            return turn
+        guess = index.words[guess_id]
+        pattern = score_guess(guess, answer)
+        candidates &= index.matching_feedback(guess, pattern)
+    return None
+
+
+def play_games(index, strategy, answer_ids):
+    """
+    Return a list of (guess count, seconds) tuples, one per game.
+    """
+    results = []
+    for answer_id in answer_ids:
+        start = time.perf_counter()
+        guesses = play_game(index, strategy, answer_id)
+        results.append((guesses, time.perf_counter() - start))
+    return results
+
+
+# The index and strategy of a simulation worker process, set up once by its
+# initializer.
+_worker_index = None
+_worker_strategy = None
+
+
+def _initialize_simulation_worker(strategy_name, word_source_path):
+    global _worker_index, _worker_strategy
+    _worker_index = WordIndex.from_file(word_source_path)
+    _worker_strategy = STRATEGIES[strategy_name](_worker_index, word_source_path)
+
+
+def _play_games_chunk(answer_ids):
+    return play_games(_worker_index, _worker_strategy, answer_ids)
+
+
+class SimulationReport:
+    def __init__(self, strategy_name, results, seconds):
+        self.strategy_name = strategy_name
+        self.games = len(results)
+        self.histogram = Counter(guesses for guesses, _ in results if guesses)
+        self.unsolved = sum(1 for guesses, _ in results if guesses is None)
+        self.failures = self.unsolved + sum(
+            count for guesses, count in self.histogram.items() if guesses > MAX_GUESSES
+        )
+        solved = self.games - self.unsolved
+        total_guesses = sum(
+            guesses * count for guesses, count in self.histogram.items()
+        )
+        self.mean_guesses = total_guesses / solved if solved else 0.0
+        self.seconds = seconds
+        self.game_seconds = sum(game_seconds for _, game_seconds in results)
+
+    def lines(self):
+        yield f"Strategy: {self.strategy_name}"
+        yield f"Games: {self.games}"
+        yield "Guesses  Games"
+        for guesses in sorted(self.histogram):
+            yield f"{guesses:>7}  {self.histogram[guesses]}"
+        if self.unsolved:
+            yield f"{'>' + str(MAX_TURNS):>7}  {self.unsolved}"
+        yield f"Mean guesses: {self.mean_guesses:.4f}"
+        yield f"Failures (more than {MAX_GUESSES} guesses): {self.failures}"
+        games = self.games or 1
+        yield (
+            f"Wall time: {self.seconds:.2f}s "
+            f"({self.seconds / games * 1000:.3f}ms per game), "
+            f"time in games: {self.game_seconds:.2f}s "
+            f"({self.game_seconds / games * 1000:.3f}ms per game)"
+        )
+
+
+def simulate(
+    strategy_name,
+    workers=1,
+    chunk_size=SIMULATION_CHUNK_SIZE,
+    games=None,
+    word_source_path=WORD_SOURCE_PATH,
+):
+    """
+    Play a game against every word of `word_source_path`, or against its first
+    `games` words, with the strategy named `strategy_name` and return a
+    SimulationReport. With more than one worker, or with 0 for one per CPU,
+    games are spread over processes that each set up the index and strategy
+    once.
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        index = WordIndex.from_file(word_source_path)
+        strategy = STRATEGIES[strategy_name](index, word_source_path)
+        answer_ids = range(len(index.words))[:games]
+        results = play_games(index, strategy, answer_ids)
+    else:
+        answer_count = sum(1 for _ in read_words(word_source_path))
+        answer_ids = range(answer_count)[:games]
+        chunks = [
+            answer_ids[i : i + chunk_size]
+            for i in range(0, len(answer_ids), chunk_size)
+        ]
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_simulation_worker,
+            initargs=(strategy_name, word_source_path),
+        ) as executor:
+            for chunk_results in executor.map(_play_games_chunk, chunks):
+                results.extend(chunk_results)
+    return SimulationReport(strategy_name, results, time.perf_counter() - start)
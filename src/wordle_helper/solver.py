@@ -0,0 +1,54 @@
+from wordle_helper.feedback import PATTERN_COUNT
+from wordle_helper.optional import np
+
+# Upper bound on the number of (guess, candidate) cells handled at once, which
+# keeps the int64 bincount input of a ranking around 32 MB.
+ENTROPY_CHUNK_CELLS = 1 << 22
+
+
+def guess_entropies(matrix, candidate_ids, guess_ids=None):
+    """
+    Return the expected information in bits of each guess row of the feedback
+    `matrix` (or of the `guess_ids` rows) over the answers in `candidate_ids`,
+    as a float array in guess order.
+    """
+    candidate_ids = np.asarray(candidate_ids, dtype=np.intp)
+    if guess_ids is None:
+        guess_ids = np.arange(matrix.shape[0])
+    guess_ids = np.asarray(guess_ids, dtype=np.intp)
+    candidate_count = len(candidate_ids)
+    entropies = np.zeros(len(guess_ids))
+    if candidate_count == 0:
+        return entropies
+
+    chunk_size = max(1, ENTROPY_CHUNK_CELLS // candidate_count)
+    for start in range(0, len(guess_ids), chunk_size):
+        chunk_ids = guess_ids[start : start + chunk_size]
+        patterns = matrix[chunk_ids[:, None], candidate_ids[None, :]]
+        # Shift the pattern codes of every row into their own range of bins so
+        # one bincount counts the patterns of all the rows of the chunk.
+        offsets = np.arange(len(chunk_ids))[:, None] * PATTERN_COUNT
+        counts = np.bincount(
+            (patterns + offsets).ravel(), minlength=len(chunk_ids) * PATTERN_COUNT
+        ).reshape(len(chunk_ids), PATTERN_COUNT)
+        nonzero_counts = np.where(counts > 0, counts, 1)
+        weighted = (counts * np.log2(nonzero_counts)).sum(axis=1)
+        entropies[start : start + len(chunk_ids)] = (
+            np.log2(candidate_count) - weighted / candidate_count
+        )
+    return entropies
+
+
+def rank_guesses(matrix, candidate_ids, top=10, guess_ids=None):
+    """
+    Return a list of up to `top` (guess id, entropy) tuples for the best guesses
+    over the answers in `candidate_ids`, best first. Ties go to guesses that
+    can still be the answer, then to the earliest word.
+    """
+    if guess_ids is None:
+        guess_ids = np.arange(matrix.shape[0])
+    guess_ids = np.asarray(guess_ids, dtype=np.intp)
+    entropies = guess_entropies(matrix, candidate_ids, guess_ids=guess_ids)
+    is_candidate = np.isin(guess_ids, candidate_ids)
+    ranking = np.lexsort((guess_ids, ~is_candidate, -entropies))[:top]
+    return [(int(guess_ids[i]), float(entropies[i])) for i in ranking]
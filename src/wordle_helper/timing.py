@@ -0,0 +1,119 @@
+import time
+from contextlib import contextmanager, nullcontext
+from threading import Lock, local
+
+
+class PhaseTimer:
+    """
+    Wall-clock seconds and call counts per named phase of a run, such as
+    "load" or "query", measured with the monotonic `time.perf_counter`.
+
+    Phases nest: while a phase runs inside another, only the inner one is
+    charged, so the seconds of all phases add up to the time spent in them.
+    Each thread keeps its own stack of running phases, so one timer can be
+    shared by the threads of a service, for example through
+    `WordleHelper(timer=...)`.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self.lock = Lock()
+        self.local = local()
+
+    def add(self, name, seconds, calls=1):
+        with self.lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + calls
+
+    def _enter(self, name):
+        stack = self.local.__dict__.setdefault("stack", [])
+        now = time.perf_counter()
+        if stack:
+            outer, started = stack[-1]
+            self.add(outer, now - started, calls=0)
+        stack.append((name, now))
+
+    def _exit(self, calls):
+        stack = self.local.stack
+        name, started = stack.pop()
+        now = time.perf_counter()
+        self.add(name, now - started, calls=calls)
+        if stack:
+            stack[-1] = (stack[-1][0], now)
+
+    @contextmanager
+    def phase(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit(calls=1)
+
+    def iterate(self, name, iterable):
+        """
+        Yield from `iterable`, charging the time taken to produce each item,
+        including creating its iterator, to the phase `name`.
+        """
+        self._enter(name)
+        try:
+            iterator = iter(iterable)
+        finally:
+            self._exit(calls=1)
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit(calls=0)
+            yield item
+
+    def stats(self):
+        """
+        Return a dict mapping every phase to its "seconds" and "calls".
+        """
+        with self.lock:
+            return {
+                name: {"seconds": seconds, "calls": self.calls[name]}
+                for name, seconds in self.seconds.items()
+            }
+
+    def total(self):
+        with self.lock:
+            return sum(self.seconds.values())
+
+    def lines(self):
+        """
+        Return the lines of a report of every phase, in the order they first
+        ran, followed by their total.
+        """
+        with self.lock:
+            phases = list(self.seconds.items())
+        width = max([len("total")] + [len(name) for name, _seconds in phases])
+        lines = [
+            f"{name:<{width}} {seconds * 1000:10.3f} ms" for name, seconds in phases
+        ]
+        total = sum(seconds for _name, seconds in phases)
+        lines.append(f"{'total':<{width}} {total * 1000:10.3f} ms")
+        return lines
+
+
+class NullTimer(PhaseTimer):
+    """
+    PhaseTimer that measures nothing, the default of the functions taking a
+    timer.
+    """
+
+    def add(self, name, seconds, calls=1):
+        pass
+
+    def phase(self, name):
+        return nullcontext()
+
+    def iterate(self, name, iterable):
+        return iter(iterable)
+
+
+NULL_TIMER = NullTimer()
@@ -0,0 +1,157 @@
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from wordle_helper.feedback import ALL_GREEN, PATTERN_COUNT
+from wordle_helper.files import atomic_write_path
+from wordle_helper.optional import np
+from wordle_helper.solver import rank_guesses
+from wordle_helper.words import WORD_SOURCE_PATH, word_source_checksum
+
+TREE_MAGIC = b"WHTREE"
+TREE_VERSION = 1
+# Magic, version, word list checksum, node count and edge count.
+TREE_HEADER = struct.Struct("<6sH40sII")
+
+
+def decision_tree_path(word_source_path=WORD_SOURCE_PATH):
+    return Path(word_source_path).with_suffix(".tree")
+
+
+class DecisionTree:
+    """
+    Solver decision tree over a word list. Node 0 is the opener. Every node
+    holds the id of the word to guess there and maps each feedback pattern that
+    guess can receive, other than all green, to the node to go to next.
+    """
+
+    def __init__(self, guesses, edge_starts, edge_patterns, edge_children):
+        self.guesses = guesses
+        self.edge_starts = edge_starts
+        self.edge_patterns = edge_patterns
+        self.edge_children = edge_children
+        self.children = {}
+        for node in range(len(guesses)):
+            for edge in range(edge_starts[node], edge_starts[node + 1]):
+                self.children[node * PATTERN_COUNT + edge_patterns[edge]] = (
+                    edge_children[edge]
+                )
+
+    def next_node(self, node, pattern):
+        """
+        Return the node reached from `node` on feedback `pattern`, or None if
+        the tree has no such branch.
+        """
+        return self.children.get(node * PATTERN_COUNT + pattern)
+
+
+def build_decision_tree(matrix, opener_id, candidate_ids=None):
+    """
+    Return the DecisionTree that opens with `opener_id` and then always guesses
+    the highest-entropy word over the remaining candidates, out of all the
+    words of the feedback `matrix`.
+    """
+    if candidate_ids is None:
+        candidate_ids = np.arange(matrix.shape[0])
+    guesses = []
+    edges = []
+
+    def add_node(guess_id, candidate_ids):
+        node = len(guesses)
+        guesses.append(guess_id)
+        node_edges = []
+        edges.append(node_edges)
+        patterns = np.asarray(matrix[guess_id, candidate_ids])
+        by_pattern = np.argsort(patterns, kind="stable")
+        sorted_patterns = patterns[by_pattern]
+        splits = np.flatnonzero(np.diff(sorted_patterns)) + 1
+        for group in np.split(by_pattern, splits):
+            pattern = int(patterns[group[0]])
+            if pattern == ALL_GREEN:
+                continue
+            group_ids = candidate_ids[group]
+            if len(group_ids) <= 2:
+                next_guess_id = int(group_ids[0])
+            else:
+                next_guess_id, _entropy = rank_guesses(matrix, group_ids, top=1)[0]
+            node_edges.append((pattern, add_node(next_guess_id, group_ids)))
+        return node
+
+    add_node(opener_id, np.asarray(candidate_ids))
+
+    edge_starts = array("I", [0])
+    edge_patterns = array("B")
+    edge_children = array("I")
+    for node_edges in edges:
+        for pattern, child in node_edges:
+            edge_patterns.append(pattern)
+            edge_children.append(child)
+        edge_starts.append(len(edge_patterns))
+    return DecisionTree(array("I", guesses), edge_starts, edge_patterns, edge_children)
+
+
+def _little_endian(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def save_decision_tree(tree, tree_path, word_source_path=WORD_SOURCE_PATH):
+    """
+    Write `tree` to `tree_path` as a header followed by the node and edge
+    arrays, all little-endian.
+    """
+    header = TREE_HEADER.pack(
+        TREE_MAGIC,
+        TREE_VERSION,
+        word_source_checksum(word_source_path).encode("ascii"),
+        len(tree.guesses),
+        len(tree.edge_patterns),
+    )
+    with atomic_write_path(tree_path) as build_path, open(build_path, "wb") as f:
+        f.write(header)
+        for values in (
+            tree.guesses,
+            tree.edge_starts,
+            tree.edge_patterns,
+            tree.edge_children,
+        ):
+            _little_endian(values).tofile(f)
+
+
+def load_decision_tree(tree_path, word_source_path=WORD_SOURCE_PATH):
+    """
+    Return the DecisionTree saved at `tree_path`. Raise a ValueError if it is
+    not a decision tree file or was built from another word list.
+    """
+    with open(tree_path, "rb") as f:
+        data = f.read()
+    if len(data) < TREE_HEADER.size:
+        raise ValueError(f"{tree_path} is not a decision tree file")
+    magic, version, checksum, node_count, edge_count = TREE_HEADER.unpack_from(data)
+    if magic != TREE_MAGIC or version != TREE_VERSION:
+        raise ValueError(f"{tree_path} is not a version {TREE_VERSION} decision tree")
+    if checksum.decode("ascii") != word_source_checksum(word_source_path):
+        raise ValueError(
+            f"{tree_path} was built from another word list: rebuild it with "
+            "`wordle_helper build-tree`"
+        )
+
+    offset = TREE_HEADER.size
+    arrays = []
+    for typecode, count in (
+        ("I", node_count),
+        ("I", node_count + 1),
+        ("B", edge_count),
+        ("I", edge_count),
+    ):
+        values = array(typecode)
+        end = offset + count * values.itemsize
+        values.frombytes(data[offset:end])
+        arrays.append(_little_endian(values))
+        offset = end
+    if offset != len(data):
+        raise ValueError(f"{tree_path} is truncated or corrupted")
+    return DecisionTree(*arrays)
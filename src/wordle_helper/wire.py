@@ -0,0 +1,109 @@
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+
+from wordle_helper.constraints import CONSTRAINT_FIELDS
+
+DAEMON_SOCKET_ENV = "WORDLE_HELPER_SOCKET"
+
+# Requests are a big-endian uint32 length followed by the constraint values in
+# CONSTRAINT_FIELDS order, UTF-8 encoded and separated by NUL bytes, with an
+# empty value for a missing constraint. Responses are a status byte and a
+# uint32 length followed by the matching words separated by newlines, or by
+# an error message.
+REQUEST_HEADER = struct.Struct(">I")
+RESPONSE_HEADER = struct.Struct(">BI")
+STATUS_OK = 0
+STATUS_ERROR = 1
+FIELD_SEPARATOR = "\0"
+MAX_REQUEST_SIZE = 1 << 16
+
+
+def daemon_socket_path():
+    """
+    Return the socket path of $WORDLE_HELPER_SOCKET, or of the current user's
+    $XDG_RUNTIME_DIR, or else of a directory of the current user in the shared
+    temporary directory, which the daemon creates readable by that user only.
+    """
+    if os.environ.get(DAEMON_SOCKET_ENV):
+        return Path(os.environ[DAEMON_SOCKET_ENV])
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "wordle_helper.sock"
+    directory = Path(tempfile.gettempdir()) / f"wordle_helper-{os.getuid()}"
+    return directory / "wordle_helper.sock"
+
+
+def is_own_socket(socket_path):
+    """
+    Return whether `socket_path` is a socket of the current user, so that a
+    socket another local user bound first at a predictable path is never
+    trusted to answer queries.
+    """
+    try:
+        info = os.stat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def encode_request(constraints):
+    values = (constraints.get(field) or "" for field in CONSTRAINT_FIELDS)
+    payload = FIELD_SEPARATOR.join(values).encode("utf-8")
+    return REQUEST_HEADER.pack(len(payload)) + payload
+
+
+def decode_request(payload):
+    values = payload.decode("utf-8").split(FIELD_SEPARATOR)
+    if len(values) != len(CONSTRAINT_FIELDS):
+        raise ValueError(f"Expected {len(CONSTRAINT_FIELDS)} constraint values")
+    return {field: value or None for field, value in zip(CONSTRAINT_FIELDS, values)}
+
+
+def encode_response(status, text):
+    payload = text.encode("utf-8")
+    return RESPONSE_HEADER.pack(status, len(payload)) + payload
+
+
+def is_daemon_running(socket_path):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+    except OSError:
+        return False
+    return True
+
+
+def _receive_exactly(client, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = client.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("The daemon closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+def query_daemon(constraints, socket_path=None):
+    """
+    Return the words matching `constraints` as answered by the daemon listening
+    on `socket_path`, or None if no daemon of the current user answers there.
+    """
+    socket_path = socket_path or daemon_socket_path()
+    if not is_own_socket(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(encode_request(constraints))
+            status, size = RESPONSE_HEADER.unpack(
+                _receive_exactly(client, RESPONSE_HEADER.size)
+            )
+            text = _receive_exactly(client, size).decode("utf-8")
+    except OSError:
+        return None
+    if status != STATUS_OK:
+        return None
+    return text.split("\n") if text else []
@@ -0,0 +1,57 @@
+import hashlib
+from pathlib import Path
+from string import ascii_lowercase, punctuation
+
+WORD_SOURCE_PATH = Path(__file__).parent / "data/sgb-words.txt"
+PREBUILT_DB_PATH = WORD_SOURCE_PATH.with_suffix(".sqlite")
+
+# SQLite's LIKE treats these as wildcards, so `Word.word.contains()` with
+# either of them matches every word.
+LIKE_WILDCARDS = "%_"
+
+# The bit of each letter in the letter mask of a word.
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ascii_lowercase)}
+
+
+def read_words(word_source_path=WORD_SOURCE_PATH):
+    with open(word_source_path, "r") as f:
+        words = f.read().splitlines()
+    for i, word in enumerate(words, start=1):
+        if len(word) != 5 or any(c for c in word if c in punctuation):
+            continue
+        yield word.lower(), i
+
+
+def letter_bit(letter):
+    """
+    Return the bit of an `a`-`z` letter in a letter mask, or 0 for anything
+    else.
+    """
+    return LETTER_BITS.get(letter, 0)
+
+
+def letter_mask(letters):
+    """
+    Return the 26 bit mask of the `a`-`z` letters in `letters`.
+    """
+    mask = 0
+    for letter in letters:
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+
+def like_letter(letter):
+    """
+    Return `letter` the way SQLite's LIKE compares it: ASCII letters are case
+    folded and wildcards are returned as None, meaning "matches any word".
+    """
+    if letter in LIKE_WILDCARDS:
+        return None
+    if "A" <= letter <= "Z":
+        return letter.lower()
+    return letter
+
+
+def word_source_checksum(word_source_path=WORD_SOURCE_PATH):
+    with open(word_source_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
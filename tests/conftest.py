@@ -0,0 +1,14 @@
+import pytest
+
+from wordle_helper.helper import WordleHelper
+
+
+@pytest.fixture(scope="module")
+def helper():
+    """
+    A WordleHelper on the default engine and word list, shared by the tests of
+    a module.
+    """
+    helper = WordleHelper()
+    yield helper
+    helper.close()
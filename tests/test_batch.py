@@ -0,0 +1,67 @@
+import json
+import random
+
+import pytest
+
+from wordle_helper import batch
+from wordle_helper.batch import run_batch, run_batch_parallel
+from wordle_helper.constraints import constraints_from_feedback
+from wordle_helper.engines import PostingsEngine
+from wordle_helper.feedback import score_guess
+from wordle_helper.words import read_words
+
+LINES = [
+    json.dumps({"first_letter": "s", "unused_letters": "adpiun"}),
+    json.dumps({"not_second_letter": "e", "unused_letters": "xyz"}),
+    json.dumps({}),
+]
+
+
+def test_batch_worker_uses_the_engine(monkeypatch):
+    monkeypatch.setattr(batch, "_worker_helper", None)
+    batch._initialize_batch_worker("postings", batch.WORD_SOURCE_PATH, 0)
+    assert isinstance(batch._worker_helper.engine, PostingsEngine)
+
+
+@pytest.mark.parametrize("engine", ["postings", "sql"])
+def test_batch_parallel_with_engine(helper, engine):
+    expected = list(run_batch(helper, LINES))
+    results = run_batch_parallel(LINES, workers=2, chunk_size=1, engine=engine)
+    assert list(results) == expected
+
+
+INVALID_LINES = [
+    "not json",
+    "[1, 2]",
+    json.dumps({"first_letter": 5}),
+    json.dumps({"nope": "x"}),
+]
+
+
+def batch_lines(count, seed=0):
+    """
+    Return `count` lines of realistic queries, with invalid and blank lines
+    mixed in.
+    """
+    rng = random.Random(seed)
+    words = [word for word, _order in read_words()]
+    lines = []
+    for _ in range(count):
+        answer = rng.choice(words)
+        guesses = rng.sample(words, rng.randint(1, 2))
+        constraints = constraints_from_feedback(
+            (guess, score_guess(guess, answer)) for guess in guesses
+        )
+        lines.append(json.dumps(constraints))
+        if rng.random() < 0.1:
+            lines.append(rng.choice(INVALID_LINES + ["", "  "]))
+    return lines
+
+
+def test_batch_parallel_keeps_input_order(helper):
+    lines = batch_lines(300)
+    expected = list(run_batch(helper, lines))
+    assert any("error" in json.loads(result) for result in expected)
+    assert len(expected) == sum(1 for line in lines if line.strip())
+    results = run_batch_parallel(lines, workers=4, chunk_size=7)
+    assert list(results) == expected
@@ -0,0 +1,100 @@
+import random
+from array import array
+
+import pytest
+
+from wordle_helper.bitmaps import ARRAY_MAX_SIZE, CHUNK_SIZE, RoaringBitmap
+
+# Fractions of the ids of a chunk in a set: empty, sparse chunks stored as
+# arrays, on either side of ARRAY_MAX_SIZE, and dense chunks stored as bitsets.
+DENSITIES = [0, 0.001, 0.05, 0.07, 0.5, 1]
+CHUNKS = 5
+SIZE = CHUNKS * CHUNK_SIZE - 1000
+
+
+def random_ids(rng):
+    ids = set()
+    for chunk in range(CHUNKS):
+        density = rng.choice(DENSITIES)
+        start = chunk * CHUNK_SIZE
+        stop = min(start + CHUNK_SIZE, SIZE)
+        ids.update(i for i in range(start, stop) if rng.random() < density)
+    return ids
+
+
+def bitmap(ids):
+    # Ids in any order, as sets give them.
+    ids = list(ids)
+    random.Random(len(ids)).shuffle(ids)
+    return RoaringBitmap.from_ids(ids)
+
+
+def container_kinds(bitmap):
+    return {type(container) for container in bitmap.containers.values()}
+
+
+@pytest.fixture(scope="module")
+def id_sets():
+    rng = random.Random(0)
+    return [random_ids(rng) for _ in range(6)]
+
+
+def test_containers_switch_at_array_max_size():
+    sparse = RoaringBitmap.from_ids(range(ARRAY_MAX_SIZE))
+    dense = RoaringBitmap.from_ids(range(ARRAY_MAX_SIZE + 1))
+    assert container_kinds(sparse) == {array}
+    assert container_kinds(dense) == {int}
+
+
+def test_random_sets_mix_container_kinds(id_sets):
+    kinds = set()
+    for ids in id_sets:
+        kinds |= container_kinds(bitmap(ids))
+    assert kinds == {array, int}
+
+
+def test_from_ids_iterates_in_order(id_sets):
+    for ids in id_sets:
+        result = bitmap(ids)
+        assert list(result) == sorted(ids)
+        assert len(result) == len(ids)
+        assert bool(result) == bool(ids)
+
+
+def test_full():
+    full = RoaringBitmap.full(SIZE)
+    assert len(full) == SIZE
+    assert list(full) == list(range(SIZE))
+    assert not RoaringBitmap.full(0)
+
+
+def test_and_matches_sets(id_sets):
+    for a in id_sets:
+        for b in id_sets:
+            result = bitmap(a) & bitmap(b)
+            assert list(result) == sorted(a & b)
+            assert len(result) == len(a & b)
+            # Chunks left empty are dropped.
+            assert all(result.containers.values())
+
+
+def test_and_not_matches_sets(id_sets):
+    for a in id_sets:
+        for b in id_sets:
+            result = bitmap(a) & ~bitmap(b)
+            assert list(result) == sorted(a - b)
+            assert len(result) == len(a - b)
+
+
+def test_chained_operations_match_sets(id_sets):
+    full = RoaringBitmap.full(SIZE)
+    expected = set(range(SIZE))
+    result = full
+    for i, ids in enumerate(id_sets):
+        if i % 3 == 2:
+            result &= ~bitmap(ids)
+            expected -= ids
+        else:
+            result &= bitmap(ids | set(range(0, SIZE, 2)))
+            expected &= ids | set(range(0, SIZE, 2))
+        assert list(result) == sorted(expected)
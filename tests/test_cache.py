@@ -0,0 +1,110 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from wordle_helper.cache import EMPTY_KEY, CacheStats, QueryCache, canonical_key
+from wordle_helper.constraints import CONSTRAINT_FIELDS, Constraints
+from wordle_helper.engines import load_engine
+
+# A small alphabet, so that random queries often share a key: lower and upper
+# case letters, LIKE wildcards and a letter in no word.
+QUERY_LETTERS = "aesAE%_é"
+
+EQUIVALENT_QUERIES = [
+    (Constraints(unused_letters="adpiun"), Constraints(unused_letters="nupida")),
+    (Constraints(not_third_letter="rr"), Constraints(not_third_letter="r")),
+    (Constraints(unused_letters="E"), Constraints(unused_letters="e")),
+    (Constraints(not_first_letter="A"), Constraints(not_second_letter="A")),
+    (Constraints(not_first_letter="%%"), Constraints(not_first_letter="%")),
+    (
+        Constraints(first_letter="s", not_first_letter="s"),
+        Constraints(first_letter="s"),
+    ),
+]
+
+EMPTY_QUERIES = [
+    Constraints(unused_letters="%"),
+    Constraints(unused_letters="_"),
+    Constraints(first_letter="S"),
+    Constraints(first_letter="s", unused_letters="s"),
+    Constraints(not_first_letter="e", unused_letters="E"),
+    Constraints(not_second_letter="ex", unused_letters="x"),
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    # tests/test_engines.py checks that this engine gives the results of SQL.
+    engine = load_engine("bitset")
+    yield engine
+    engine.close()
+
+
+def words(engine, constraints):
+    return list(engine.query(constraints))
+
+
+@pytest.mark.parametrize("constraints, other", EQUIVALENT_QUERIES)
+def test_equivalent_queries_share_a_key_and_results(engine, constraints, other):
+    assert canonical_key(constraints) == canonical_key(other)
+    assert words(engine, constraints) == words(engine, other)
+
+
+@pytest.mark.parametrize("constraints", EMPTY_QUERIES)
+def test_unmatchable_queries_get_the_empty_key(engine, constraints):
+    assert canonical_key(constraints) == EMPTY_KEY
+    assert words(engine, constraints) == []
+
+
+def random_constraints(rng):
+    values = []
+    for field in CONSTRAINT_FIELDS:
+        if field == "unused_letters":
+            size = rng.randint(0, 3) if rng.random() < 0.5 else 0
+        elif field.startswith("not_"):
+            size = rng.randint(0, 3) if rng.random() < 0.3 else 0
+        else:
+            size = 1 if rng.random() < 0.1 else 0
+        values.append("".join(rng.choice(QUERY_LETTERS) for _ in range(size)) or None)
+    return Constraints(*values)
+
+
+def test_equal_keys_give_equal_results(engine):
+    rng = random.Random(0)
+    results = defaultdict(set)
+    for _ in range(2000):
+        constraints = random_constraints(rng)
+        results[canonical_key(constraints)].add(tuple(words(engine, constraints)))
+    # Random queries must often share keys for this test to mean anything.
+    assert len(results) < 1000
+    for key, key_results in results.items():
+        assert len(key_results) == 1, key
+    assert results[EMPTY_KEY] == {()}
+
+
+def test_cache_evicts_least_recently_used():
+    cache = QueryCache(maxsize=2)
+    cache.put("a", ("apple",))
+    cache.put("b", ("berry",))
+    assert cache.get("a") == ("apple",)
+    cache.put("c", ("cherry",))
+    assert cache.get("b") is None
+    assert cache.get("a") == ("apple",)
+    assert cache.get("c") == ("cherry",)
+    cache.put("d", ("dates",))
+    assert cache.get("a") is None
+    assert list(cache.results) == ["c", "d"]
+
+
+def test_cache_counts_hits_misses_and_evictions():
+    cache = QueryCache(maxsize=1)
+    assert cache.stats() == CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=1)
+    assert cache.get("a") is None
+    cache.put("a", ())
+    assert cache.get("a") == ()
+    cache.put("b", ("berry",))
+    cache.put("b", ("berry",))
+    assert cache.stats() == CacheStats(hits=1, misses=1, evictions=1, size=1, maxsize=1)
+    cache.clear()
+    assert cache.stats().size == 0
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import wordle_helper
+from wordle_helper import wire
+from wordle_helper.client import main, parse_query_args
+from wordle_helper.constraints import CONSTRAINT_FIELDS
+from wordle_helper.daemon import QueryDaemon, run_daemon
+from wordle_helper.wire import (
+    DAEMON_SOCKET_ENV,
+    REQUEST_HEADER,
+    daemon_socket_path,
+    decode_request,
+    encode_request,
+    query_daemon,
+)
+
+QUERY = {"first_letter": "s", "unused_letters": "adpiun"}
+
+
+def constraints(**values):
+    return {**dict.fromkeys(CONSTRAINT_FIELDS), **values}
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ([], constraints()),
+        (["-1", "s", "-u", "adpiun"], constraints(**QUERY)),
+        (["--first_letter=s", "--unused_letters", "adpiun"], constraints(**QUERY)),
+        (["-n3", "r", "-n3", "e"], constraints(not_third_letter="e")),
+        (["--not_fifth_letter="], constraints(not_fifth_letter="")),
+    ],
+)
+def test_parse_query_args(args, expected):
+    assert parse_query_args(args) == expected
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--batch"],
+        ["-1", "s", "--count"],
+        ["-1"],
+        ["-1=s"],
+        ["serve"],
+        ["--engine", "sql", "-1", "s"],
+    ],
+)
+def test_parse_query_args_leaves_other_args_to_the_cli(args):
+    assert parse_query_args(args) is None
+
+
+@pytest.mark.parametrize(
+    "values",
+    [constraints(), constraints(**QUERY), constraints(not_first_letter="é%_")],
+)
+def test_request_round_trip(values):
+    request = encode_request(values)
+    (size,) = REQUEST_HEADER.unpack(request[: REQUEST_HEADER.size])
+    payload = request[REQUEST_HEADER.size :]
+    assert size == len(payload)
+    assert decode_request(payload) == values
+
+
+def test_decode_request_rejects_missing_values():
+    with pytest.raises(ValueError):
+        decode_request(b"s\0")
+
+
+def test_default_socket_is_in_a_directory_of_the_user(monkeypatch, tmp_path):
+    monkeypatch.delenv(DAEMON_SOCKET_ENV, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(wire.tempfile, "gettempdir", lambda: str(tmp_path))
+    path = daemon_socket_path()
+    assert path.parent == tmp_path / f"wordle_helper-{os.getuid()}"
+
+
+@pytest.fixture
+def daemon_socket(helper, tmp_path):
+    """
+    The path of a QueryDaemon socket served by an event loop in a thread.
+    """
+    socket_path = tmp_path / "daemon.sock"
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(
+        asyncio.start_unix_server(
+            QueryDaemon(helper).handle_connection, path=str(socket_path)
+        )
+    )
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    yield socket_path
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
+
+
+def test_query_daemon(helper, daemon_socket):
+    assert query_daemon(constraints(**QUERY), daemon_socket) == helper.query(**QUERY)
+
+
+def test_query_daemon_distrusts_sockets_of_other_users(daemon_socket, monkeypatch):
+    monkeypatch.setattr(wire.os, "getuid", lambda: os.stat(daemon_socket).st_uid + 1)
+    assert query_daemon(constraints(**QUERY), daemon_socket) is None
+
+
+def test_query_daemon_without_daemon(tmp_path):
+    assert query_daemon(constraints(**QUERY), tmp_path / "missing.sock") is None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as unbound:
+        unbound.bind(str(tmp_path / "stale.sock"))
+    assert query_daemon(constraints(**QUERY), tmp_path / "stale.sock") is None
+
+
+def test_main_falls_back_to_the_cli_without_daemon(helper, tmp_path, monkeypatch):
+    monkeypatch.setenv(DAEMON_SOCKET_ENV, str(tmp_path / "missing.sock"))
+    output = tmp_path / "output"
+    with open(output, "w") as f:
+        monkeypatch.setattr("sys.stdout", f)
+        with pytest.raises(SystemExit) as exit_info:
+            main(["-1", "s", "-u", "adpiun"])
+    assert exit_info.value.code == 0
+    assert output.read_text().split() == helper.query(**QUERY)
+
+
+def test_daemon_socket_is_private_from_the_start(helper, tmp_path, monkeypatch):
+    socket_path = tmp_path / "private" / "daemon.sock"
+    modes = []
+
+    async def serve():
+        task = asyncio.ensure_future(run_daemon(helper, socket_path))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        modes.append(stat.S_IMODE(os.stat(socket_path).st_mode))
+        modes.append(stat.S_IMODE(os.stat(socket_path.parent).st_mode))
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(serve())
+    assert modes == [0o600, 0o700]
+    assert not socket_path.exists()
+
+
+# Run in a fresh interpreter: import the client, run it with the arguments if
+# any, and print the top-level packages then imported to stderr.
+IMPORTED_PACKAGES_SCRIPT = """
+import sys
+from wordle_helper.client import main
+if sys.argv[1:]:
+    try:
+        main(sys.argv[1:])
+    except SystemExit:
+        pass
+sys.stderr.write(" ".join(sorted({name.partition(".")[0] for name in sys.modules})))
+"""
+
+
+@pytest.mark.parametrize("args", [[], ["-1", "s", "-u", "adpiun"], ["--count"]])
+def test_client_imports_neither_sqlalchemy_nor_numpy(args):
+    package_parent = Path(wordle_helper.__file__).parent.parent
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            [str(package_parent), os.environ.get("PYTHONPATH", "")]
+        ),
+        **{DAEMON_SOCKET_ENV: os.devnull},
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORTED_PACKAGES_SCRIPT, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages = result.stderr.split()
+    assert "wordle_helper" in packages
+    assert "sqlalchemy" not in packages
+    assert "numpy" not in packages
+    if args:
+        assert result.stdout
@@ -0,0 +1,132 @@
+import csv
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from wordle_helper.console import cli
+from wordle_helper.output import format_words
+from wordle_helper.words import read_words
+
+SGB_WORDS = [word for word, _order in read_words()]
+QUERY = ["-1", "s", "-u", "adpiun"]
+# Matches nothing, since no word has a "%".
+EMPTY_QUERY = ["-1", "%"]
+
+
+@pytest.fixture(scope="module")
+def expected_words():
+    result = CliRunner().invoke(cli, QUERY)
+    assert result.exit_code == 0, result.output
+    words = result.output.splitlines()
+    assert len(words) == 107
+    return words
+
+
+def run(*args, input=None):
+    result = CliRunner(mix_stderr=False).invoke(cli, list(args), input=input)
+    assert result.exit_code == 0, result.stderr
+    return result.stdout
+
+
+def test_csv(expected_words):
+    rows = list(csv.reader(io.StringIO(run(*QUERY, "--format", "csv"))))
+    assert rows == [["word"]] + [[word] for word in expected_words]
+
+
+@pytest.mark.parametrize(
+    "word", ["plain", 'say "hi"', "a,b", "two\nlines", "cr\rlf", 'all ",\r\n']
+)
+def test_csv_quoting_round_trips(word):
+    text = "".join(format_words([word, "next"], "csv"))
+    assert list(csv.reader(io.StringIO(text, newline=""))) == [
+        ["word"],
+        [word],
+        ["next"],
+    ]
+
+
+def test_json(expected_words):
+    assert json.loads(run(*QUERY, "--format", "json")) == expected_words
+
+
+def test_empty_json():
+    assert json.loads(run(*EMPTY_QUERY, "--format", "json")) == []
+
+
+def test_ndjson(expected_words):
+    lines = run(*QUERY, "--format", "ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"word": word} for word in expected_words
+    ]
+
+
+def test_limit(expected_words):
+    assert json.loads(run(*QUERY, "--limit", "3", "--format", "json")) == (
+        expected_words[:3]
+    )
+
+
+@pytest.mark.parametrize("query, count", [(QUERY, 107), (EMPTY_QUERY, 0), ([], None)])
+def test_count_in_each_format(query, count):
+    if count is None:
+        count = len(SGB_WORDS)
+    assert run(*query, "--count") == f"{count}\n"
+    assert run(*query, "--count", "--format", "plain") == f"{count}\n"
+    assert json.loads(run(*query, "--count", "--format", "json")) == {"count": count}
+    assert json.loads(run(*query, "--count", "--format", "ndjson")) == {"count": count}
+    rows = list(csv.reader(io.StringIO(run(*query, "--count", "--format", "csv"))))
+    assert rows == [["count"], [str(count)]]
+
+
+def test_batch():
+    lines = [json.dumps({"first_letter": "s", "unused_letters": "adpiun"})]
+    (result,) = run("--batch", input="\n".join(lines) + "\n").splitlines()
+    assert len(json.loads(result)["words"]) == 107
+
+
+@pytest.mark.parametrize(
+    "args, rejected",
+    [
+        (["--count"], "--count"),
+        (["--limit", "1"], "--limit"),
+        (["--format", "plain"], "--format"),
+        (["--disk-cache"], "--disk-cache"),
+        (["--disk-cache-entries", "5"], "--disk-cache-entries"),
+        (["-2", "x"], "--second_letter"),
+        (["-u", "xyz", "-n3", "r"], "--not_third_letter, --unused_letters"),
+        (
+            ["--count", "--limit", "1", "--format", "csv", "-2", "x"],
+            "--second_letter, --count, --limit, --format",
+        ),
+    ],
+)
+def test_batch_rejects_query_options(args, rejected):
+    result = CliRunner(mix_stderr=False).invoke(cli, ["--batch", *args], input="{}\n")
+    assert result.exit_code == 2
+    assert result.stdout == ""
+    assert f"--batch cannot be used with {rejected}." in result.stderr
+
+
+@pytest.mark.parametrize(
+    "args, rejected",
+    [
+        (["--workers", "2"], "--workers"),
+        (["--chunk-size", "10"], "--chunk-size"),
+        (["--workers", "1", "--chunk-size", "10"], "--workers, --chunk-size"),
+    ],
+)
+def test_batch_options_need_batch(args, rejected):
+    result = CliRunner(mix_stderr=False).invoke(cli, [*args, "-1", "s"])
+    assert result.exit_code == 2
+    assert result.stdout == ""
+    assert f"{rejected} can only be used with --batch." in result.stderr
+
+
+def test_batch_with_workers():
+    lines = [json.dumps({"first_letter": "s"}), json.dumps({"unused_letters": "e"})]
+    expected = run("--batch", input="\n".join(lines))
+    assert run(
+        "--batch", "--workers", "2", "--chunk-size", "1", input="\n".join(lines)
+    ) == (expected)
@@ -0,0 +1,195 @@
+import pytest
+from click.testing import CliRunner
+from sqlalchemy.orm import Session
+
+from wordle_helper import database as database_module
+from wordle_helper.commands import build_database_command
+from wordle_helper.constraints import Constraints
+from wordle_helper.database import (
+    Word,
+    _words_query,
+    explain_query_plan,
+    is_database_current,
+    open_database,
+    open_read_only_database,
+    setup_database,
+)
+
+POSITIONS = ["first", "second", "third", "fourth", "fifth"]
+
+
+@pytest.fixture(scope="module")
+def database():
+    engine = setup_database()
+    yield engine
+    engine.dispose()
+
+
+def compiled_sql(database, constraints):
+    with Session(database) as session:
+        query = _words_query(session, None, constraints)
+        return str(query.statement.compile(dialect=database.dialect))
+
+
+def assert_uses_index(plan, index_name):
+    """
+    Check that the EXPLAIN QUERY PLAN lines `plan` read the table through
+    `index_name` only, and sort nothing. The wording of the lines varies across
+    SQLite versions, such as "SCAN TABLE words" before 3.36 and "SCAN words"
+    since, so only the index name is matched.
+    """
+    assert len(plan) == 1, plan
+    assert f"USING INDEX {index_name}" in plan[0]
+    assert "TEMP B-TREE" not in plan[0]
+
+
+@pytest.mark.parametrize("position", POSITIONS)
+def test_fixed_letter_searches_its_position_index(database, position):
+    constraints = Constraints(**{f"{position}_letter": "s"})
+    plan = explain_query_plan(database, *constraints)
+    assert_uses_index(plan, f"ix_words_{position}_letter_order")
+    assert plan[0].startswith("SEARCH")
+
+
+def test_fixed_letter_with_other_constraints_needs_no_sort(database):
+    constraints = Constraints(
+        first_letter="s", not_second_letter="ae", unused_letters="adpiun"
+    )
+    plan = explain_query_plan(database, *constraints, limit=10)
+    assert_uses_index(plan, "ix_words_first_letter_order")
+
+
+@pytest.mark.parametrize("limit", [None, 10])
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        Constraints(),
+        Constraints(unused_letters="adpiun"),
+        Constraints(not_third_letter="r", unused_letters="xyz"),
+    ],
+)
+def test_unfixed_query_scans_in_order(database, constraints, limit):
+    plan = explain_query_plan(database, *constraints, limit=limit)
+    assert_uses_index(plan, "ix_words_order")
+    assert plan[0].startswith("SCAN")
+
+
+def test_ascii_letters_are_matched_with_the_letter_mask(database):
+    constraints = Constraints(not_first_letter="aE", unused_letters="Xyz")
+    sql = compiled_sql(database, constraints)
+    assert "LIKE" not in sql
+    assert "letter_mask" in sql
+
+
+@pytest.mark.parametrize("letter", ["é", "%", "_"])
+def test_other_letters_are_matched_with_like(database, letter):
+    for constraints in [
+        Constraints(not_first_letter=letter),
+        Constraints(unused_letters=letter),
+    ]:
+        assert "LIKE" in compiled_sql(database, constraints)
+
+
+def test_letter_mask_has_a_bit_per_letter(database):
+    with Session(database) as session:
+        masks = dict(session.query(Word.word, Word.letter_mask))
+    assert masks["which"] == (1 << 22) | (1 << 7) | (1 << 8) | (1 << 2)
+    assert all(
+        mask == sum(1 << ord(letter) - ord("a") for letter in set(word))
+        for word, mask in masks.items()
+    )
+
+
+@pytest.fixture
+def word_source_path(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("crane\nstony\nwhich\n")
+    return path
+
+
+def word_count(engine):
+    with Session(engine) as session:
+        return session.query(Word).count()
+
+
+def open_and_close(word_db_path, word_source_path):
+    """
+    Open the database as the sql engine does, and return its number of words
+    and the inode of its file, which a rebuild replaces.
+    """
+    engine = open_database(word_db_path, word_source_path=word_source_path)
+    count = word_count(engine)
+    engine.dispose()
+    return count, word_db_path.stat().st_ino
+
+
+def test_current_database_is_reused(tmp_path, word_source_path):
+    word_db_path = tmp_path / "words.db"
+    first = open_and_close(word_db_path, word_source_path)
+    assert first[0] == 3
+    assert open_and_close(word_db_path, word_source_path) == first
+
+
+def test_changed_word_list_rebuilds(tmp_path, word_source_path):
+    word_db_path = tmp_path / "words.db"
+    _count, inode = open_and_close(word_db_path, word_source_path)
+    with open(word_source_path, "a") as f:
+        f.write("eerie\n")
+    engine = open_read_only_database(word_db_path)
+    assert not is_database_current(engine, word_source_path=word_source_path)
+    engine.dispose()
+    count, rebuilt_inode = open_and_close(word_db_path, word_source_path)
+    assert count == 4
+    assert rebuilt_inode != inode
+
+
+def test_other_schema_version_rebuilds(tmp_path, word_source_path, monkeypatch):
+    word_db_path = tmp_path / "words.db"
+    _count, inode = open_and_close(word_db_path, word_source_path)
+    monkeypatch.setattr(
+        database_module, "SCHEMA_VERSION", database_module.SCHEMA_VERSION + 1
+    )
+    engine = open_read_only_database(word_db_path)
+    assert not is_database_current(engine, word_source_path=word_source_path)
+    engine.dispose()
+    rebuilt = open_and_close(word_db_path, word_source_path)
+    assert rebuilt[1] != inode
+    # Built by the new version, so now current.
+    assert open_and_close(word_db_path, word_source_path) == rebuilt
+
+
+def test_corrupt_database_rebuilds(tmp_path, word_source_path):
+    word_db_path = tmp_path / "words.db"
+    word_db_path.write_bytes(b"not a database" * 100)
+    engine = open_read_only_database(word_db_path)
+    assert not is_database_current(engine, word_source_path=word_source_path)
+    engine.dispose()
+    assert open_and_close(word_db_path, word_source_path)[0] == 3
+
+
+@pytest.mark.parametrize("pool_size", [None, 2])
+def test_unwritable_database_falls_back_to_memory(
+    tmp_path, word_source_path, pool_size
+):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    engine = open_database(
+        not_a_directory / "words.db",
+        word_source_path=word_source_path,
+        pool_size=pool_size,
+    )
+    assert engine.url.database == ":memory:"
+    assert word_count(engine) == 3
+    engine.dispose()
+
+
+def test_build_database_command(tmp_path, word_source_path):
+    word_db_path = tmp_path / "words.db"
+    args = ["--word-source", str(word_source_path), "--database", str(word_db_path)]
+    result = CliRunner().invoke(build_database_command, args)
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith(f"Built {word_db_path}: loaded 3 words")
+    result = CliRunner().invoke(build_database_command, args)
+    assert result.output == f"{word_db_path} is up to date\n"
+    result = CliRunner().invoke(build_database_command, [*args, "--force"])
+    assert result.output.startswith(f"Built {word_db_path}")
@@ -0,0 +1,90 @@
+from itertools import count
+from types import SimpleNamespace
+
+import pytest
+
+from wordle_helper import disk_cache
+from wordle_helper.disk_cache import DiskCache
+from wordle_helper.helper import WordleHelper
+
+KEY = ("s", None, None, None, None)
+WORDS = ("sassy", "shell")
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # A clock that always moves on, so that the least recently used entry is
+    # never ambiguous.
+    clock = count()
+    monkeypatch.setattr(disk_cache, "time", SimpleNamespace(time=lambda: next(clock)))
+    cache = DiskCache(tmp_path / "cache" / "results.sqlite", max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_results_are_kept_across_instances(cache):
+    cache.put("checksum", KEY, WORDS)
+    cache.put("checksum", ("empty",), ())
+    cache.close()
+    reopened = DiskCache(cache.path)
+    assert reopened.get("checksum", KEY) == WORDS
+    assert reopened.get("checksum", ("empty",)) == ()
+    reopened.close()
+
+
+def test_other_checksum_misses(cache):
+    cache.put("checksum", KEY, WORDS)
+    assert cache.get("other checksum", KEY) is None
+    assert cache.get("checksum", ("other key",)) is None
+
+
+def test_least_recently_used_are_evicted_at_max_entries(cache):
+    for i in range(3):
+        cache.put("checksum", (i,), (f"word{i}",))
+    assert cache.get("checksum", (0,)) == ("word0",)
+    cache.put("checksum", (3,), ("word3",))
+    assert cache.get("checksum", (1,)) is None
+    assert [cache.get("checksum", (i,)) for i in (0, 2, 3)] == [
+        ("word0",),
+        ("word2",),
+        ("word3",),
+    ]
+    (entries,) = cache.connection.execute("SELECT COUNT(*) FROM results").fetchone()
+    assert entries == 3
+
+
+def test_clear(cache):
+    cache.put("checksum", KEY, WORDS)
+    cache.clear()
+    assert cache.get("checksum", KEY) is None
+
+
+def test_unwritable_path_misses(tmp_path):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    cache = DiskCache(not_a_directory / "results.sqlite")
+    cache.put("checksum", KEY, WORDS)
+    assert cache.get("checksum", KEY) is None
+    cache.clear()
+    cache.close()
+
+
+def test_corrupt_file_misses(tmp_path):
+    path = tmp_path / "results.sqlite"
+    path.write_bytes(b"not a database" * 100)
+    cache = DiskCache(path)
+    cache.put("checksum", KEY, WORDS)
+    assert cache.get("checksum", KEY) is None
+    cache.close()
+
+
+def test_helper_answers_from_disk_without_loading(tmp_path):
+    path = tmp_path / "results.sqlite"
+    helper = WordleHelper(disk_cache=DiskCache(path))
+    words = helper.query(first_letter="s", unused_letters="adpiun")
+    helper.close()
+
+    helper = WordleHelper(disk_cache=DiskCache(path))
+    assert helper.query(unused_letters="nupida", first_letter="s") == words
+    assert helper.engine is None
+    helper.close()
@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from wordle_helper.constraints import CONSTRAINT_FIELDS, Constraints
+from wordle_helper.database import setup_database
+from wordle_helper.engines import ENGINES, SQLEngine, load_engine
+from wordle_helper.postings import PostingIndex
+from wordle_helper.words import read_words
+
+# Letters of random queries: common and rare letters, upper case letters, which
+# LIKE folds but == does not, SQLite's LIKE wildcards and a letter in no word.
+QUERY_LETTERS = "aeiorstlnucdpmhgbfywkvxzjqAES%_é"
+
+QUERIES = [
+    Constraints(),
+    Constraints(first_letter="s", unused_letters="adpiun"),
+    Constraints(first_letter="", not_first_letter="", unused_letters=""),
+    Constraints(third_letter="a", not_third_letter="e"),
+    Constraints(not_first_letter="ae", not_third_letter="r", unused_letters="x"),
+    Constraints(first_letter="S"),
+    Constraints(not_second_letter="S"),
+    Constraints(unused_letters="E"),
+    Constraints(not_fourth_letter="%"),
+    Constraints(unused_letters="_"),
+    Constraints(fifth_letter="é"),
+    Constraints(first_letter="q", second_letter="u", not_fifth_letter="e"),
+    Constraints(first_letter="s", unused_letters="s"),
+    Constraints(not_first_letter="z", unused_letters="z"),
+]
+
+
+def random_constraints(rng):
+    values = []
+    for field in CONSTRAINT_FIELDS:
+        if field == "unused_letters":
+            size = rng.randint(0, 8) if rng.random() < 0.6 else 0
+        elif field.startswith("not_"):
+            size = rng.randint(0, 3) if rng.random() < 0.3 else 0
+        else:
+            size = 1 if rng.random() < 0.15 else 0
+        values.append("".join(rng.choice(QUERY_LETTERS) for _ in range(size)) or None)
+    return Constraints(*values)
+
+
+QUERIES.extend(random_constraints(random.Random(seed)) for seed in range(300))
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """
+    The SQL semantics the engines must reproduce, from an in-memory database.
+    """
+    engine = SQLEngine(setup_database())
+    yield engine
+    engine.close()
+
+
+@pytest.fixture(scope="module", params=list(ENGINES))
+def engine(request, tmp_path_factory):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    word_db_path = tmp_path_factory.mktemp("engines") / "words.sqlite"
+    engine = load_engine(request.param, word_db_path=word_db_path)
+    yield engine
+    engine.close()
+
+
+@pytest.mark.parametrize("constraints", QUERIES)
+def test_engine_query_matches_sql(engine, reference, constraints):
+    assert list(engine.query(constraints)) == list(reference.query(constraints))
+
+
+@pytest.mark.parametrize("constraints", QUERIES)
+def test_engine_count_matches_sql(engine, reference, constraints):
+    assert engine.count(constraints) == len(list(reference.query(constraints)))
+
+
+@pytest.mark.parametrize("limit", [0, 1, 7, 100000])
+def test_engine_query_stops_at_limit(engine, reference, limit):
+    constraints = Constraints(not_second_letter="e")
+    expected = list(reference.query(constraints))[:limit]
+    assert list(engine.query(constraints, limit=limit)) == expected
+
+
+def test_engine_len_is_word_count(engine, reference):
+    assert len(engine) == len(reference) == 5757
+
+
+def test_load_engine_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        load_engine("nosuchengine")
+
+
+class CountingWords(tuple):
+    """
+    Words that count how many times one of them is looked up.
+    """
+
+    lookups = 0
+
+    def __getitem__(self, i):
+        self.lookups += 1
+        return super().__getitem__(i)
+
+
+def test_postings_limit_stops_checking_words():
+    words = [word for word, _order in read_words()]
+    index = PostingIndex(words)
+    index.words = CountingWords(words)
+    assert len(list(index.query(unused_letters="z", limit=3))) == 3
+    # Each matching word is looked up once to check it, then once to return it.
+    assert index.words.lookups == 6
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from wordle_helper.feedback import format_feedback, parse_feedback, score_guess
+from wordle_helper.matrix import build_feedback_matrix
+from wordle_helper.words import read_words
+
+# Guesses and answers with repeated letters, whose feedback is worked out by
+# hand: a repeated guess letter is yellow only as many times as the answer has
+# copies of it that are not green, from left to right.
+SCORED_GUESSES = [
+    ("which", "which", "ggggg"),
+    ("adieu", "stony", "....."),
+    ("geese", "eerie", ".gy.g"),
+    ("eerie", "geese", "yg..g"),
+    ("speed", "abide", "..y.y"),
+    ("aabbb", "bbaaa", "yyyy."),
+    ("bbaaa", "aabbb", "yyyy."),
+    ("llama", "hello", "yy..."),
+    ("hello", "llama", "..yy."),
+    ("sassy", "essay", "yyg.g"),
+    ("error", "rower", "yy.yg"),
+]
+
+WORDS = [word for word, _order in read_words()]
+
+
+@pytest.mark.parametrize("guess, answer, feedback", SCORED_GUESSES)
+def test_score_guess(guess, answer, feedback):
+    assert format_feedback(score_guess(guess, answer)) == feedback
+
+
+def test_feedback_round_trips():
+    for pattern in range(3**5):
+        assert parse_feedback(format_feedback(pattern)) == pattern
+
+
+@pytest.mark.parametrize("feedback", ["gy.g", "gy..gg", "gy.?g"])
+def test_parse_feedback_rejects_invalid_feedback(feedback):
+    with pytest.raises(ValueError):
+        parse_feedback(feedback)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 256])
+def test_feedback_matrix_matches_score_guess(chunk_size):
+    pytest.importorskip("numpy")
+    words = WORDS[:400] + [guess for guess, _answer, _feedback in SCORED_GUESSES]
+    words.extend(random.Random(0).sample(WORDS[400:], 100))
+    matrix = build_feedback_matrix(words, chunk_size=chunk_size)
+    expected = [[score_guess(guess, answer) for answer in words] for guess in words]
+    assert matrix.tolist() == expected
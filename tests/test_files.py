@@ -0,0 +1,29 @@
+import os
+import stat
+
+import pytest
+
+from wordle_helper.files import atomic_write_path
+
+
+def test_atomic_write_path_moves_file_into_place(tmp_path):
+    path = tmp_path / "data.bin"
+    with atomic_write_path(path) as build_path:
+        with open(build_path, "wb") as f:
+            f.write(b"data")
+        assert not path.exists()
+    assert path.read_bytes() == b"data"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert os.listdir(tmp_path) == ["data.bin"]
+
+
+def test_atomic_write_path_keeps_old_file_on_error(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with atomic_write_path(path) as build_path:
+            with open(build_path, "wb") as f:
+                f.write(b"new")
+            raise RuntimeError
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["data.bin"]
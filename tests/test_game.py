@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+import pytest
+from click.testing import CliRunner
+
+from wordle_helper.bitmaps import CompressedWordIndex
+from wordle_helper.commands import play
+from wordle_helper.feedback import PATTERN_COUNT, parse_feedback, score_guess
+from wordle_helper.game import Game
+from wordle_helper.index import WordIndex
+from wordle_helper.words import read_words
+
+SGB_WORDS = [word for word, _order in read_words()]
+
+# Common words, and words with repeated letters whose feedback has greys and
+# yellows of the same letter.
+WORDS = SGB_WORDS[:150] + [
+    "geese",
+    "eerie",
+    "aabbb",
+    "bbaaa",
+    "llama",
+    "hello",
+    "sassy",
+    "essay",
+    "error",
+    "rower",
+    "speed",
+    "abide",
+]
+
+
+@pytest.fixture(scope="module", params=[WordIndex, CompressedWordIndex])
+def index(request):
+    return request.param(WORDS)
+
+
+def test_matching_feedback_matches_score_guess(index):
+    for guess in WORDS:
+        answers = defaultdict(set)
+        for answer in WORDS:
+            answers[score_guess(guess, answer)].add(answer)
+        for pattern in range(PATTERN_COUNT):
+            matching = set(index.words_in(index.matching_feedback(guess, pattern)))
+            assert matching == answers[pattern], (guess, pattern)
+
+
+def test_game_narrows_and_resets(index):
+    game = Game(index)
+    assert game.count() == len(WORDS)
+    answer = "essay"
+    for guess in ["sassy", "speed"]:
+        game.play_round(guess, score_guess(guess, answer))
+    expected = [
+        word
+        for word in WORDS
+        if score_guess("sassy", word) == score_guess("sassy", answer)
+        and score_guess("speed", word) == score_guess("speed", answer)
+    ]
+    assert list(game.words()) == expected
+    assert game.count() == len(expected)
+    assert answer in expected
+
+    game.reset()
+    assert list(game.words()) == WORDS
+
+
+def test_game_without_tree_suggests_nothing(index):
+    game = Game(index)
+    game.play_round("crane", parse_feedback("....."))
+    assert game.suggestion() is None
+
+
+def test_game_follows_tree_until_it_leaves_it(index):
+    pytest.importorskip("numpy")
+    from wordle_helper.matrix import build_feedback_matrix
+    from wordle_helper.tree import build_decision_tree
+
+    tree = build_decision_tree(build_feedback_matrix(WORDS), 0)
+    game = Game(index, tree=tree)
+    opener = game.suggestion()
+    assert opener == WORDS[0]
+
+    game.play_round(opener, score_guess(opener, "essay"))
+    suggestion = game.suggestion()
+    assert suggestion in game.words()
+    game.play_round("crane", score_guess("crane", "essay"))
+    assert game.suggestion() is None
+
+    game.reset()
+    assert game.suggestion() == opener
+
+
+def words_left_line(words, show=10):
+    more = " ..." if len(words) > show else ""
+    return f"{len(words)} words left: {' '.join(words[:show])}{more}"
+
+
+def test_play():
+    input_lines = ["crane g.y..", "words", "reset", "quit"]
+    result = CliRunner().invoke(play, input="\n".join(input_lines) + "\n")
+    assert result.exit_code == 0, result.output
+
+    pattern = parse_feedback("g.y..")
+    remaining = [word for word in SGB_WORDS if score_guess("crane", word) == pattern]
+    assert remaining
+    lines = result.output.splitlines()
+    assert lines[-7:] == [
+        "> crane g.y..",
+        words_left_line(remaining),
+        "> words",
+        " ".join(remaining),
+        "> reset",
+        words_left_line(SGB_WORDS),
+        "> quit",
+    ]
+
+
+def test_play_rejects_invalid_feedback():
+    result = CliRunner().invoke(play, input="crane gyq..\nquit\n")
+    assert result.exit_code == 0
+    assert "Invalid feedback 'gyq..'" in result.output
+    assert "words left" not in result.output
@@ -0,0 +1,106 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from wordle_helper.constraints import constraints_from_feedback
+from wordle_helper.feedback import score_guess
+from wordle_helper.helper import WordleHelper
+from wordle_helper.words import read_words
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("unexpected engine call")
+
+
+@pytest.fixture
+def helper():
+    helper = WordleHelper(cache_size=16)
+    yield helper
+    helper.close()
+
+
+def test_count_miss_counts_with_the_engine(helper, monkeypatch):
+    monkeypatch.setattr(helper.engine, "query", fail)
+    assert helper.count(first_letter="s", unused_letters="adpiun") == 107
+    assert helper.cache.stats().size == 0
+
+
+def test_count_hit_skips_the_engine(helper, monkeypatch):
+    words = helper.query(first_letter="s", unused_letters="adpiun")
+    monkeypatch.setattr(helper.engine, "count", fail)
+    monkeypatch.setattr(helper.engine, "query", fail)
+    assert helper.count(unused_letters="nupida", first_letter="s") == len(words)
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="Unknown engine 'nosuchengine'"):
+        WordleHelper(engine="nosuchengine")
+
+
+def random_queries(count, seed=0):
+    rng = random.Random(seed)
+    words = [word for word, _order in read_words()]
+    queries = []
+    for _ in range(count):
+        answer = rng.choice(words)
+        guesses = rng.sample(words, rng.randint(0, 2))
+        queries.append(
+            constraints_from_feedback(
+                (guess, score_guess(guess, answer)) for guess in guesses
+            )
+        )
+    return queries
+
+
+def answer(helper, query_number, constraints):
+    # Vary the limits and interleave counts, so that threads hold connections
+    # for different lengths of time.
+    limit = [None, 1, 10][query_number % 3]
+    return helper.query(limit=limit, **constraints), helper.count(**constraints)
+
+
+@pytest.fixture(scope="module")
+def expected_answers():
+    queries = random_queries(300)
+    helper = WordleHelper()
+    answers = [answer(helper, i, query) for i, query in enumerate(queries)]
+    helper.close()
+    return queries, answers
+
+
+@pytest.fixture(params=["bitset", "QueuePool", "StaticPool"])
+def threaded_helper(request, tmp_path):
+    """
+    Return the options of a helper shared by threads, and the class of the pool
+    of its database connections, if any.
+    """
+    if request.param == "bitset":
+        return {"engine": "bitset"}, None
+    if request.param == "QueuePool":
+        word_db_path = tmp_path / "words.db"
+    else:
+        # Building the database fails, so the helper falls back to one
+        # in-memory database shared by all threads.
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("")
+        word_db_path = not_a_directory / "words.db"
+    options = {"engine": "sql", "word_db_path": word_db_path, "pool_size": 2}
+    return options, request.param
+
+
+@pytest.mark.parametrize("cache_size", [0, 64])
+def test_threads_get_the_sequential_answers(
+    threaded_helper, cache_size, expected_answers
+):
+    queries, expected = expected_answers
+    options, pool_class = threaded_helper
+    helper = WordleHelper(cache_size=cache_size, **options)
+    if pool_class is not None:
+        assert type(helper.engine.database.pool).__name__ == pool_class
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        answers = list(
+            executor.map(answer, [helper] * len(queries), range(len(queries)), queries)
+        )
+    helper.close()
+    assert answers == expected
@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import pytest
+
+from wordle_helper.server import MAX_HEADER_LINES, QueryServer
+
+
+def exchange_all(helper, request):
+    """
+    Send the raw bytes `request` to a QueryServer and return the status code and
+    JSON payload of each of its responses, until it closes the connection.
+    """
+
+    async def run():
+        server = await asyncio.start_server(
+            QueryServer(helper).handle_connection, "127.0.0.1", 0
+        )
+        async with server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+        responses = []
+        while response:
+            head, _, response = response.partition(b"\r\n\r\n")
+            content_length = int(head.split(b"Content-Length: ")[1].split()[0])
+            body, response = response[:content_length], response[content_length:]
+            responses.append((int(head.split()[1]), json.loads(body)))
+        return responses
+
+    return asyncio.run(run())
+
+
+def exchange(helper, request):
+    """
+    Return the status code and JSON payload of the first response to `request`.
+    """
+    return exchange_all(helper, request)[0]
+
+
+def test_query_words(helper):
+    status, payload = exchange(
+        helper,
+        b"GET /words?first_letter=s&unused_letters=adpiun HTTP/1.1\r\n"
+        b"Connection: close\r\n\r\n",
+    )
+    assert status == 200
+    assert payload["count"] == 107 == len(payload["words"])
+
+
+def test_negative_content_length_is_a_bad_request(helper):
+    status, payload = exchange(
+        helper, b"POST /count HTTP/1.1\r\nContent-Length: -5\r\n\r\n"
+    )
+    assert status == 400
+    assert payload == {"error": "Invalid Content-Length"}
+
+
+def test_overlong_request_line_is_a_bad_request(helper):
+    status, _payload = exchange(helper, b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n")
+    assert status == 400
+
+
+def test_overlong_header_is_rejected(helper):
+    status, _payload = exchange(
+        helper, b"GET /count HTTP/1.1\r\nX-Long: " + b"a" * 70000 + b"\r\n\r\n"
+    )
+    assert status == 431
+
+
+@pytest.mark.parametrize("lines", [MAX_HEADER_LINES, MAX_HEADER_LINES + 1])
+def test_too_many_headers_are_rejected(helper, lines):
+    headers = b"".join(b"X-Header-%d: x\r\n" % i for i in range(lines - 1))
+    request = b"GET /count HTTP/1.1\r\n" + headers + b"Connection: close\r\n\r\n"
+    status, payload = exchange(helper, request)
+    if lines > MAX_HEADER_LINES:
+        assert (status, payload) == (431, {"error": "Too many request headers"})
+    else:
+        assert status == 200
+
+
+def test_unexpected_errors_answer_500_and_keep_the_connection(helper, monkeypatch):
+    def fail(**constraints):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(helper, "count", fail)
+    responses = exchange_all(
+        helper,
+        b"GET /count HTTP/1.1\r\n\r\n"
+        b"GET /words?first_letter=s&unused_letters=adpiun HTTP/1.1\r\n"
+        b"Connection: close\r\n\r\n",
+    )
+    assert [status for status, _payload in responses] == [500, 200]
+    assert responses[0][1] == {"error": "Internal server error"}
+    assert responses[1][1]["count"] == 107
@@ -0,0 +1,114 @@
+from collections import Counter
+
+import pytest
+from click.testing import CliRunner
+
+from wordle_helper.commands import simulate_command
+from wordle_helper.feedback import score_guess
+from wordle_helper.simulate import MAX_TURNS, SimulationReport, simulate
+
+# Guessing the first candidate, the words that differ only by a first letter
+# not in "crane" are found one guess at a time, so the last ones take more than
+# six.
+WORDS = [
+    "crane",
+    "bight",
+    "dight",
+    "fight",
+    "hight",
+    "light",
+    "might",
+    "sight",
+    "tight",
+    "wight",
+    "stony",
+    "geese",
+    "eerie",
+    "llama",
+    "hello",
+]
+
+
+@pytest.fixture(scope="module")
+def word_source_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("simulate") / "words.txt"
+    path.write_text("".join(f"{word}\n" for word in WORDS))
+    return path
+
+
+def first_candidate_guesses(answer):
+    candidates = list(WORDS)
+    for guesses in range(1, MAX_TURNS + 1):
+        guess = candidates[0]
+        if guess == answer:
+            return guesses
+        pattern = score_guess(guess, answer)
+        candidates = [
+            word for word in candidates if score_guess(guess, word) == pattern
+        ]
+
+
+def report_lines(report):
+    lines = list(report.lines())
+    assert lines[-1].startswith("Wall time: ")
+    return lines[:-1]
+
+
+def test_first_candidate_report(word_source_path):
+    report = simulate("first", workers=1, word_source_path=word_source_path)
+    histogram = Counter(first_candidate_guesses(answer) for answer in WORDS)
+    failures = sum(count for guesses, count in histogram.items() if guesses > 6)
+    assert failures == 4
+    assert report_lines(report) == [
+        "Strategy: first",
+        f"Games: {len(WORDS)}",
+        "Guesses  Games",
+        *(f"{guesses:>7}  {histogram[guesses]}" for guesses in sorted(histogram)),
+        f"Mean guesses: {sum(histogram.elements()) / len(WORDS):.4f}",
+        f"Failures (more than 6 guesses): {failures}",
+    ]
+
+
+def test_games_plays_the_first_words(word_source_path):
+    report = simulate("first", workers=1, games=3, word_source_path=word_source_path)
+    assert report.games == 3
+    assert report.histogram == Counter(
+        first_candidate_guesses(answer) for answer in WORDS[:3]
+    )
+
+
+@pytest.mark.parametrize("games", [None, 7])
+def test_workers_match_one_process(word_source_path, games):
+    reports = [
+        simulate(
+            "first",
+            workers=workers,
+            chunk_size=2,
+            games=games,
+            word_source_path=word_source_path,
+        )
+        for workers in (1, 2)
+    ]
+    assert report_lines(reports[0]) == report_lines(reports[1])
+
+
+def test_unsolved_games_are_failures():
+    report = SimulationReport("test", [(1, 0.5), (7, 0.5), (None, 1.0)], seconds=2.0)
+    assert list(report.lines()) == [
+        "Strategy: test",
+        "Games: 3",
+        "Guesses  Games",
+        "      1  1",
+        "      7  1",
+        f"    >{MAX_TURNS}  1",
+        "Mean guesses: 4.0000",
+        "Failures (more than 6 guesses): 2",
+        "Wall time: 2.00s (666.667ms per game), "
+        "time in games: 2.00s (666.667ms per game)",
+    ]
+
+
+def test_simulate_command():
+    result = CliRunner().invoke(simulate_command, ["--games", "3", "--workers", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[:2] == ["Strategy: first", "Games: 3"]
@@ -0,0 +1,73 @@
+import random
+from collections import Counter
+from math import log2
+
+import pytest
+
+from wordle_helper import solver
+from wordle_helper.feedback import score_guess
+from wordle_helper.matrix import build_feedback_matrix
+from wordle_helper.solver import guess_entropies, rank_guesses
+from wordle_helper.words import read_words
+
+pytest.importorskip("numpy")
+
+# Over the four "-ight" candidates, "bflmz" tells them all apart, "zzzzz" tells
+# nothing, and "bozzz" and every candidate only tell one from the other three.
+TIED_WORDS = ["bozzz", "bflmz", "bight", "fight", "light", "might", "zzzzz"]
+TIED_CANDIDATES = [2, 3, 4, 5]
+
+
+def entropy(guess, answers):
+    """
+    Return the expected information of `guess` in bits, from the sizes of the
+    buckets of `answers` that give each feedback pattern.
+    """
+    buckets = Counter(score_guess(guess, answer) for answer in answers)
+    return -sum(
+        size / len(answers) * log2(size / len(answers)) for size in buckets.values()
+    )
+
+
+@pytest.fixture(scope="module")
+def words():
+    return [word for word, _order in read_words()][:200]
+
+
+@pytest.fixture(scope="module")
+def matrix(words):
+    return build_feedback_matrix(words)
+
+
+@pytest.mark.parametrize("chunk_cells", [solver.ENTROPY_CHUNK_CELLS, 100])
+def test_entropies_match_feedback_buckets(words, matrix, chunk_cells, monkeypatch):
+    monkeypatch.setattr(solver, "ENTROPY_CHUNK_CELLS", chunk_cells)
+    rng = random.Random(0)
+    candidate_ids = sorted(rng.sample(range(len(words)), 40))
+    guess_ids = [0, 7, 50, 199, *candidate_ids[:3]]
+    entropies = guess_entropies(matrix, candidate_ids, guess_ids=guess_ids)
+    candidates = [words[i] for i in candidate_ids]
+    assert list(entropies) == pytest.approx(
+        [entropy(words[i], candidates) for i in guess_ids]
+    )
+
+
+def test_entropy_of_no_candidates_is_zero(matrix):
+    assert list(guess_entropies(matrix, [], guess_ids=[0, 1])) == [0, 0]
+
+
+def test_rank_guesses_orders_and_breaks_ties():
+    matrix = build_feedback_matrix(TIED_WORDS)
+    tied = entropy("bozzz", ["bight", "fight", "light", "might"])
+    ranking = rank_guesses(matrix, TIED_CANDIDATES, top=len(TIED_WORDS))
+    assert [guess_id for guess_id, _entropy in ranking] == [1, 2, 3, 4, 5, 0, 6]
+    assert [entropy for _guess_id, entropy in ranking] == pytest.approx(
+        [2, tied, tied, tied, tied, tied, 0]
+    )
+    assert rank_guesses(matrix, TIED_CANDIDATES, top=3) == ranking[:3]
+
+
+def test_rank_guesses_among_guess_ids():
+    matrix = build_feedback_matrix(TIED_WORDS)
+    ranking = rank_guesses(matrix, TIED_CANDIDATES, top=2, guess_ids=[6, 5, 0, 3])
+    assert [guess_id for guess_id, _entropy in ranking] == [3, 5]
@@ -0,0 +1,133 @@
+import pstats
+import re
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+from click.testing import CliRunner
+
+from wordle_helper import timing
+from wordle_helper.console import cli
+from wordle_helper.timing import PhaseTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(
+        timing, "time", SimpleNamespace(perf_counter=clock.perf_counter)
+    )
+    return clock
+
+
+def test_nested_phases_charge_the_inner_phase(clock):
+    timer = PhaseTimer()
+    with timer.phase("outer"):
+        clock.sleep(1)
+        with timer.phase("inner"):
+            clock.sleep(2)
+        clock.sleep(4)
+        with timer.phase("inner"):
+            clock.sleep(8)
+    assert timer.stats() == {
+        "outer": {"seconds": 5, "calls": 1},
+        "inner": {"seconds": 10, "calls": 2},
+    }
+    assert timer.total() == 15
+
+
+def test_phase_is_charged_when_it_raises(clock):
+    timer = PhaseTimer()
+    with pytest.raises(KeyError):
+        with timer.phase("failing"):
+            clock.sleep(3)
+            raise KeyError
+    assert timer.stats() == {"failing": {"seconds": 3, "calls": 1}}
+
+
+def test_iterate_charges_producing_items_only(clock):
+    timer = PhaseTimer()
+
+    def items():
+        clock.sleep(1)
+        yield "a"
+        clock.sleep(2)
+        yield "b"
+        clock.sleep(4)
+
+    class Slow:
+        def __iter__(self):
+            clock.sleep(8)
+            return items()
+
+    with timer.phase("consume"):
+        for _item in timer.iterate("produce", Slow()):
+            clock.sleep(16)
+    assert timer.stats() == {
+        "consume": {"seconds": 32, "calls": 1},
+        "produce": {"seconds": 15, "calls": 1},
+    }
+
+
+def test_threads_keep_their_own_stacks(clock):
+    # Each thread runs its phase inside the main thread's phase, which would
+    # charge the main thread's phase if the stack were shared.
+    timer = PhaseTimer()
+
+    def work():
+        with timer.phase("worker"):
+            clock.sleep(1)
+
+    with timer.phase("main"):
+        threads = [Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+        clock.sleep(2)
+    assert timer.stats() == {
+        "main": {"seconds": 6, "calls": 1},
+        "worker": {"seconds": 4, "calls": 4},
+    }
+
+
+def test_lines():
+    timer = PhaseTimer()
+    timer.add("load", 0.5)
+    timer.add("query", 0.25, calls=3)
+    assert timer.lines() == [
+        "load     500.000 ms",
+        "query    250.000 ms",
+        "total    750.000 ms",
+    ]
+
+
+def test_timings_are_printed_to_stderr():
+    result = CliRunner(mix_stderr=False).invoke(
+        cli, ["--timings", "-1", "s", "-u", "adpiun"]
+    )
+    assert result.exit_code == 0, result.stderr
+    assert len(result.stdout.splitlines()) == 107
+    lines = result.stderr.splitlines()
+    phases = [re.fullmatch(r"(\S+) +\d+\.\d{3} ms", line).group(1) for line in lines]
+    assert {"load", "query", "output", "run"} <= set(phases)
+    assert phases[-1] == "total"
+
+
+def test_profile_is_written(tmp_path):
+    profile_path = tmp_path / "run.prof"
+    result = CliRunner().invoke(cli, ["--profile", str(profile_path), "-1", "s"])
+    assert result.exit_code == 0, result.output
+    stats = pstats.Stats(str(profile_path))
+    functions = {function for _file, _line, function in stats.stats}
+    assert "query" in functions
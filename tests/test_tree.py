@@ -0,0 +1,87 @@
+import pytest
+
+from wordle_helper.feedback import ALL_GREEN, score_guess
+from wordle_helper.matrix import build_feedback_matrix
+from wordle_helper.tree import (
+    TREE_HEADER,
+    build_decision_tree,
+    load_decision_tree,
+    save_decision_tree,
+)
+from wordle_helper.words import read_words
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def word_list(tmp_path_factory):
+    words = [word for word, _order in read_words()][:300]
+    path = tmp_path_factory.mktemp("tree") / "words.txt"
+    path.write_text("".join(f"{word}\n" for word in words))
+    return words, path
+
+
+@pytest.fixture(scope="module")
+def tree(word_list):
+    words, _path = word_list
+    return build_decision_tree(build_feedback_matrix(words), 0)
+
+
+@pytest.fixture
+def tree_path(tree, word_list, tmp_path):
+    _words, word_source_path = word_list
+    tree_path = tmp_path / "words.tree"
+    save_decision_tree(tree, tree_path, word_source_path=word_source_path)
+    return tree_path
+
+
+def solve(tree, words, answer):
+    node = 0
+    for guesses in range(1, len(words) + 1):
+        guess = words[tree.guesses[node]]
+        pattern = score_guess(guess, answer)
+        if pattern == ALL_GREEN:
+            return guesses
+        node = tree.next_node(node, pattern)
+
+
+def test_tree_solves_every_word(tree, word_list):
+    words, _path = word_list
+    assert all(solve(tree, words, answer) for answer in words)
+
+
+def test_round_trip(tree, word_list, tree_path):
+    _words, word_source_path = word_list
+    loaded = load_decision_tree(tree_path, word_source_path=word_source_path)
+    for name in ("guesses", "edge_starts", "edge_patterns", "edge_children"):
+        assert getattr(loaded, name) == getattr(tree, name)
+    assert loaded.children == tree.children
+
+
+@pytest.mark.parametrize("size", [0, TREE_HEADER.size - 1, TREE_HEADER.size, -1, -4])
+def test_truncated_tree_is_rejected(word_list, tree_path, size):
+    _words, word_source_path = word_list
+    data = tree_path.read_bytes()
+    tree_path.write_bytes(data[:size])
+    with pytest.raises(ValueError):
+        load_decision_tree(tree_path, word_source_path=word_source_path)
+
+
+def test_trailing_data_is_rejected(word_list, tree_path):
+    _words, word_source_path = word_list
+    tree_path.write_bytes(tree_path.read_bytes() + b"\0\0\0\0")
+    with pytest.raises(ValueError, match="truncated or corrupted"):
+        load_decision_tree(tree_path, word_source_path=word_source_path)
+
+
+def test_other_word_list_is_rejected(tree_path):
+    with pytest.raises(ValueError, match="another word list"):
+        load_decision_tree(tree_path)
+
+
+def test_other_file_is_rejected(word_list, tree_path):
+    _words, word_source_path = word_list
+    data = tree_path.read_bytes()
+    tree_path.write_bytes(b"NOTREE" + data[6:])
+    with pytest.raises(ValueError, match="not a version"):
+        load_decision_tree(tree_path, word_source_path=word_source_path)